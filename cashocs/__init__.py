@@ -52,6 +52,7 @@ from cashocs.geometry import compute_mesh_quality
 from cashocs.geometry import interval_mesh
 from cashocs.geometry import regular_box_mesh
 from cashocs.geometry import regular_mesh
+from cashocs.geometry import regular_mesh_scaled
 from cashocs.io import convert
 from cashocs.io import import_mesh
 from cashocs.io import load_config
@@ -132,6 +133,7 @@ __all__ = [
     "LogLevel",
     "regular_mesh",
     "regular_box_mesh",
+    "regular_mesh_scaled",
     "compute_mesh_quality",
     "newton_solve",
     "picard_iteration",
@@ -164,11 +164,9 @@ class LineSearch(abc.ABC):
                 (presumably) scaled.
 
         """
-        self.search_direction_inf = np.max(
-            [
-                search_direction[i].vector().norm("linf")
-                for i in range(len(search_direction))
-            ]
+        self.search_direction_inf = max(
+            search_direction[i].vector().norm("linf")
+            for i in range(len(search_direction))
         )
 
         if has_curvature_info:
@@ -52,9 +52,7 @@ class BoxConstraints:
         self.restrictor = Restrictor(
             self.controls, self.control_constraints, self.require_control_constraints
         )
-        self.display_box_constraints = False
-        if np.any(self.require_control_constraints):
-            self.display_box_constraints = True
+        self.display_box_constraints = any(self.require_control_constraints)
 
     def _parse_control_constraints(
         self, control_constraints: Optional[List[List[Union[float, fenics.Function]]]]
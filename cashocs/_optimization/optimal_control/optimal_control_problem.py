@@ -409,7 +409,12 @@ class OptimalControlProblem(optimization_problem.OptimizationProblem):
         self._setup_control_bcs()
 
         self.solver = self._setup_solver()
-        self.solver.run()
+        try:
+            self.solver.run()
+        except BaseException as e:
+            # the output files are closed, so that their content is written to disk
+            self.output_manager.close()
+            raise e
         self.solver.post_processing()
 
     def compute_gradient(self) -> List[fenics.Function]:
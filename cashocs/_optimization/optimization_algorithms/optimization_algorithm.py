@@ -218,6 +218,8 @@ class OptimizationAlgorithm(abc.ABC):
     def post_process(self) -> None:
         """Performs the non-console output related post-processing."""
         self.output_manager.post_process()
+        self.state_problem.destroy()
+        self.gradient_problem.destroy()
 
     def nonconvergence(self) -> bool:
         """Checks for nonconvergence of the solution algorithm.
@@ -20,7 +20,7 @@
 from __future__ import annotations
 
 import functools
-import subprocess  # nosec B404
+import shutil
 from typing import Callable, Dict, List, Optional, TYPE_CHECKING, Union
 
 import dolfin.function.argument
@@ -474,6 +474,8 @@ class ShapeOptimizationProblem(optimization_problem.OptimizationProblem):
         try:
             self.solver.run()
         except BaseException as e:
+            # the output files are closed, so that their content is written to disk
+            self.output_manager.close()
             if len(self.db.parameter_db.remesh_directory) > 0:
                 self._clear_remesh_directory()
             raise e
@@ -485,9 +487,7 @@ class ShapeOptimizationProblem(optimization_problem.OptimizationProblem):
             not self.config.getboolean("Debug", "remeshing")
             and fenics.MPI.rank(fenics.MPI.comm_world) == 0
         ):
-            subprocess.run(  # nosec B603, B607
-                ["rm", "-r", self.db.parameter_db.remesh_directory], check=False
-            )
+            shutil.rmtree(self.db.parameter_db.remesh_directory, ignore_errors=True)
         fenics.MPI.barrier(fenics.MPI.comm_world)
 
     def compute_shape_gradient(self) -> List[fenics.Function]:
@@ -332,7 +332,12 @@ class TopologyOptimizationProblem(optimization_problem.OptimizationProblem):
                 self.db, self, line_search, self.algorithm
             )
 
-        self.solver.run()
+        try:
+            self.solver.run()
+        except BaseException as e:
+            # the output files are closed, so that their content is written to disk
+            self.output_manager.close()
+            raise e
         self.solver.post_processing()
 
     def plot_shape(self) -> None:
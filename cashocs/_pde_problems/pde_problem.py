@@ -57,6 +57,13 @@ class PDEProblem(abc.ABC):
         else:
             self.linear_solver = linear_solver
 
+    def destroy(self) -> None:
+        """Frees the PETSc objects which are kept between solves.
+
+        The objects are created again when the problem is solved the next time.
+        """
+        pass
+
     @abc.abstractmethod
     def solve(self) -> Union[fenics.Function, List[fenics.Function]]:
         """Solves the PDE.
@@ -112,6 +112,11 @@ class ShapeGradientProblem(pde_problem.PDEProblem):
                 self.config,
             )
 
+    def destroy(self) -> None:
+        """Destroys the SNES solvers of the p-Laplace projection, if it is used."""
+        if hasattr(self, "p_laplace_projector"):
+            self.p_laplace_projector.destroy()
+
     def solve(self) -> List[fenics.Function]:
         """Solves the Riesz projection problem to obtain the shape gradient.
 
@@ -231,19 +236,22 @@ class _PLaplaceProjector:
                 self.ksp_options = copy.deepcopy(_utils.linalg.iterative_ksp_options)
                 self.ksp_options["ksp_rtol"] = gradient_tol
 
-    def solve(self) -> None:
-        """Solves the p-Laplace problem for computing the shape gradient."""
-        self.solution.vector().vec().set(0.0)
-        self.solution.vector().apply("")
-        for nonlinear_form in self.form_list:
-            petsc_options: _typing.KspOption = {
-                "snes_type": "newtonls",
-                "snes_linesearch_type": "basic",
-                "snes_ksp_ew": True,
-            }
-            petsc_options.update(self.ksp_options)
-
-            nonlinear_solvers.snes_solve(
+        # the SNES solvers are created on demand and reused for subsequent solves.
+        # They share A_tensor and b_tensor, which is safe as they are only used one
+        # after another and each solver assembles the matrix for its own Jacobian
+        self.snes_solvers: List[nonlinear_solvers.snes.SNESSolver] = []
+
+    def _setup_snes_solvers(self) -> None:
+        """Sets up the SNES solvers for the p-Laplace problems."""
+        petsc_options: _typing.KspOption = {
+            "snes_type": "newtonls",
+            "snes_linesearch_type": "basic",
+            "snes_ksp_ew": True,
+        }
+        petsc_options.update(self.ksp_options)
+
+        self.snes_solvers = [
+            nonlinear_solvers.snes.SNESSolver(
                 nonlinear_form,
                 self.solution,
                 self.bcs_shape,
@@ -252,3 +260,21 @@ class _PLaplaceProjector:
                 A_tensor=self.A_tensor,
                 b_tensor=self.b_tensor,
             )
+            for nonlinear_form in self.form_list
+        ]
+
+    def destroy(self) -> None:
+        """Destroys the SNES solvers, which are created again for the next solve."""
+        for snes_solver in self.snes_solvers:
+            snes_solver.destroy()
+        self.snes_solvers = []
+
+    def solve(self) -> None:
+        """Solves the p-Laplace problem for computing the shape gradient."""
+        if not self.snes_solvers:
+            self._setup_snes_solvers()
+
+        self.solution.vector().vec().set(0.0)
+        self.solution.vector().apply("")
+        for snes_solver in self.snes_solvers:
+            snes_solver.solve()
@@ -19,7 +19,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 import fenics
 
@@ -97,6 +97,8 @@ class StateProblem(pde_problem.PDEProblem):
         self.res_j_tensors = [
             fenics.PETScVector() for _ in range(self.db.parameter_db.state_dim)
         ]
+        # the SNES solvers are created on demand and reused for subsequent solves
+        self.snes_solvers: Dict[int, nonlinear_solvers.snes.SNESSolver] = {}
 
         self._number_of_solves = 0
         if self.db.parameter_db.temp_dict:
@@ -116,6 +118,39 @@ class StateProblem(pde_problem.PDEProblem):
         self.db.parameter_db.optimization_state["no_state_solves"] = value
         self._number_of_solves = value
 
+    def _get_snes_solver(self, i: int) -> nonlinear_solvers.snes.SNESSolver:
+        """Returns the SNES solver for the i-th state equation.
+
+        The solver is created on the first call, so that the Jacobian and the
+        assemblers are only set up once and reused for all subsequent solves.
+
+        Args:
+            i: The index of the state equation.
+
+        Returns:
+            The SNES solver for the i-th state equation.
+
+        """
+        if i not in self.snes_solvers:
+            self.snes_solvers[i] = nonlinear_solvers.snes.SNESSolver(
+                self.state_form_handler.state_eq_forms[i],
+                self.states[i],
+                self.bcs_list[i],
+                derivative=self.newton_linearizations[i],
+                petsc_options=self.db.parameter_db.state_ksp_options[i],
+                A_tensor=self.A_tensors[i],
+                b_tensor=self.b_tensors[i],
+                preconditioner_form=self.db.form_db.preconditioner_forms[i],
+            )
+
+        return self.snes_solvers[i]
+
+    def destroy(self) -> None:
+        """Destroys the SNES solvers, which are created again for the next solve."""
+        for snes_solver in self.snes_solvers.values():
+            snes_solver.destroy()
+        self.snes_solvers.clear()
+
     def _update_cost_functionals(self) -> None:
         for functional in self.db.form_db.cost_functional_list:
             functional.update()
@@ -158,16 +193,7 @@ class StateProblem(pde_problem.PDEProblem):
 
                         pc_forms = self.db.form_db.preconditioner_forms[i]
                         if self.backend == "petsc":
-                            nonlinear_solvers.snes_solve(
-                                self.state_form_handler.state_eq_forms[i],
-                                self.states[i],
-                                self.bcs_list[i],
-                                derivative=self.newton_linearizations[i],
-                                petsc_options=self.db.parameter_db.state_ksp_options[i],
-                                A_tensor=self.A_tensors[i],
-                                b_tensor=self.b_tensors[i],
-                                preconditioner_form=pc_forms,
-                            )
+                            self._get_snes_solver(i).solve()
                         else:
                             nonlinear_solvers.newton_solve(
                                 self.state_form_handler.state_eq_forms[i],
@@ -31,6 +31,7 @@ from cashocs.geometry.measure import generate_measure
 from cashocs.geometry.mesh import interval_mesh
 from cashocs.geometry.mesh import regular_box_mesh
 from cashocs.geometry.mesh import regular_mesh
+from cashocs.geometry.mesh import regular_mesh_scaled
 from cashocs.geometry.mesh_handler import _MeshHandler
 from cashocs.geometry.quality import compute_mesh_quality
 from cashocs.geometry.quality import MeshQuality
@@ -42,6 +43,7 @@ __all__ = [
     "generate_measure",
     "_EmptyMeasure",
     "regular_mesh",
+    "regular_mesh_scaled",
     "interval_mesh",
     "regular_box_mesh",
     "_MeshHandler",
@@ -22,7 +22,7 @@ from __future__ import annotations
 import collections
 import functools
 import time
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
 import fenics
 import numpy as np
@@ -38,6 +38,9 @@ if TYPE_CHECKING:
 
     from cashocs import _typing
 
+_DOLFIN_EPS = fenics.DOLFIN_EPS
+_COMPILED_SUBDOMAIN = fenics.CompiledSubDomain
+
 
 def _get_mesh_stats(
     mode: Literal["import", "generate"] = "import"
@@ -163,11 +166,12 @@ def interval_mesh(
     subdomains = fenics.MeshFunction("size_t", mesh, dim=dim)
     boundaries = fenics.MeshFunction("size_t", mesh, dim=dim - 1)
 
-    x_min = fenics.CompiledSubDomain(
-        "on_boundary && near(x[0], start, tol)", tol=fenics.DOLFIN_EPS, start=start
+    compiled_subdomain = _COMPILED_SUBDOMAIN
+    x_min = compiled_subdomain(
+        "on_boundary && near(x[0], start, tol)", tol=_DOLFIN_EPS, start=start
     )
-    x_max = fenics.CompiledSubDomain(
-        "on_boundary && near(x[0], end, tol)", tol=fenics.DOLFIN_EPS, end=end
+    x_max = compiled_subdomain(
+        "on_boundary && near(x[0], end, tol)", tol=_DOLFIN_EPS, end=end
     )
     x_min.mark(boundaries, 1)
     x_max.mark(boundaries, 2)
@@ -181,7 +185,7 @@ def interval_mesh(
             start_point = padded_partitions[i]
             end_point = padded_partitions[i + 1]
 
-            part = fenics.CompiledSubDomain(
+            part = compiled_subdomain(
                 "x[0] >= start_point && x[0] <= end_point",
                 start_point=start_point,
                 end_point=end_point,
@@ -301,35 +305,8 @@ def regular_mesh(
     subdomains = fenics.MeshFunction("size_t", mesh, dim=dim)
     boundaries = fenics.MeshFunction("size_t", mesh, dim=dim - 1)
 
-    x_min = fenics.CompiledSubDomain(
-        "on_boundary && near(x[0], 0, tol)", tol=fenics.DOLFIN_EPS
-    )
-    x_max = fenics.CompiledSubDomain(
-        "on_boundary && near(x[0], length, tol)", tol=fenics.DOLFIN_EPS, length=sizes[0]
-    )
-    x_min.mark(boundaries, 1)
-    x_max.mark(boundaries, 2)
-
-    y_min = fenics.CompiledSubDomain(
-        "on_boundary && near(x[1], 0, tol)", tol=fenics.DOLFIN_EPS
-    )
-    y_max = fenics.CompiledSubDomain(
-        "on_boundary && near(x[1], length, tol)", tol=fenics.DOLFIN_EPS, length=sizes[1]
-    )
-    y_min.mark(boundaries, 3)
-    y_max.mark(boundaries, 4)
-
-    if length_z is not None:
-        z_min = fenics.CompiledSubDomain(
-            "on_boundary && near(x[2], 0, tol)", tol=fenics.DOLFIN_EPS
-        )
-        z_max = fenics.CompiledSubDomain(
-            "on_boundary && near(x[2], length, tol)",
-            tol=fenics.DOLFIN_EPS,
-            length=sizes[2],
-        )
-        z_min.mark(boundaries, 5)
-        z_max.mark(boundaries, 6)
+    coordinates = np.asarray(mesh.coordinates())
+    _mark_box_boundaries(mesh, coordinates, boundaries, [0.0] * dim, sizes)
 
     dx = measure.NamedMeasure("dx", mesh, subdomain_data=subdomains)
     ds = measure.NamedMeasure("ds", mesh, subdomain_data=boundaries)
@@ -457,33 +434,120 @@ def regular_box_mesh(
     subdomains = fenics.MeshFunction("size_t", mesh, dim=dim)
     boundaries = fenics.MeshFunction("size_t", mesh, dim=dim - 1)
 
-    x_min = fenics.CompiledSubDomain(
-        "on_boundary && near(x[0], sx, tol)", tol=fenics.DOLFIN_EPS, sx=start_x
-    )
-    x_max = fenics.CompiledSubDomain(
-        "on_boundary && near(x[0], ex, tol)", tol=fenics.DOLFIN_EPS, ex=end_x
-    )
-    x_min.mark(boundaries, 1)
-    x_max.mark(boundaries, 2)
+    starts = [start_x, start_y]
+    ends = [end_x, end_y]
+    if start_z is not None and end_z is not None:
+        starts.append(start_z)
+        ends.append(end_z)
+    coordinates = np.asarray(mesh.coordinates())
+    _mark_box_boundaries(mesh, coordinates, boundaries, starts, ends)
 
-    y_min = fenics.CompiledSubDomain(
-        "on_boundary && near(x[1], sy, tol)", tol=fenics.DOLFIN_EPS, sy=start_y
-    )
-    y_max = fenics.CompiledSubDomain(
-        "on_boundary && near(x[1], ey, tol)", tol=fenics.DOLFIN_EPS, ey=end_y
-    )
-    y_min.mark(boundaries, 3)
-    y_max.mark(boundaries, 4)
+    dx = measure.NamedMeasure("dx", mesh, subdomain_data=subdomains)
+    ds = measure.NamedMeasure("ds", mesh, subdomain_data=boundaries)
+    d_interior_facet = measure.NamedMeasure("dS", mesh)
+
+    return mesh, subdomains, boundaries, dx, ds, d_interior_facet
+
+
+@_get_mesh_stats(mode="generate")
+def regular_mesh_scaled(
+    n: int = 10,
+    sizes: Sequence[float] = (1.0, 1.0),
+    offset: Optional[Sequence[float]] = None,
+    diagonal: Literal["right", "left", "left/right", "right/left", "crossed"] = "right",
+    comm: Optional[MPI.Comm] = None,
+) -> _typing.MeshTuple:
+    r"""Creates a mesh of a rectangle or cube by scaling a cached unit mesh.
+
+    This function creates the same mesh as :py:func:`regular_box_mesh` for the domain
+
+    .. math::
+        [o_x, o_x + s_x] \times [o_y, o_y + s_y] \left( \times [o_z, o_z + s_z] \right),
+
+    where :math:`s` are the ``sizes`` and :math:`o` is the ``offset``. The mesh
+    of the unit square or cube is only generated once for each number of elements
+    and type of diagonal and is then cached. Subsequent calls just copy the cached
+    mesh and apply an affine transformation to its coordinates, which is
+    considerably faster when many meshes of the same topology are generated, e.g.,
+    in parameter studies. The boundary markers are the same as for
+    :py:func:`regular_box_mesh`.
+
+    Args:
+        n: Number of elements in the shortest coordinate direction.
+        sizes: The lengths of the domain in each coordinate direction. The dimension
+            of the mesh is given by the length of ``sizes``, which has to be either 2
+            or 3.
+        offset: The start point of the domain. Defaults to ``None``, which means that
+            the domain starts at the origin.
+        diagonal: This defines the type of diagonal used to create the box mesh in 2D.
+            This can be one of ``"right"``, ``"left"``, ``"left/right"``,
+            ``"right/left"`` or ``"crossed"``.
+        comm: MPI communicator that is to be used for creating the mesh. The unit mesh
+            is only cached for the default communicator ``fenics.MPI.comm_world``,
+            for other communicators the mesh is generated directly.
+
+    Returns:
+        A tuple (mesh, subdomains, boundaries, dx, ds, dS), where mesh is the imported
+        FEM mesh, subdomains is a mesh function for the subdomains, boundaries is a mesh
+        function for the boundaries, dx is a volume measure, ds is a surface measure,
+        and dS is a measure for the interior facets.
 
-    if start_z is not None:
-        z_min = fenics.CompiledSubDomain(
-            "on_boundary && near(x[2], sz, tol)", tol=fenics.DOLFIN_EPS, sz=start_z
+    """
+    dim = len(sizes)
+    if dim not in (2, 3):
+        raise _exceptions.InputError(
+            "cashocs.geometry.regular_mesh_scaled",
+            "sizes",
+            "sizes must have a length of either 2 or 3.",
+        )
+    if offset is None:
+        offset = [0.0] * dim
+    if len(offset) != dim:
+        raise _exceptions.InputError(
+            "cashocs.geometry.regular_mesh_scaled",
+            "offset",
+            "offset must have the same length as sizes.",
+        )
+    if any(size <= 0 for size in sizes):
+        raise _exceptions.InputError(
+            "cashocs.geometry.regular_mesh_scaled",
+            "sizes",
+            "All entries of sizes have to be positive.",
         )
-        z_max = fenics.CompiledSubDomain(
-            "on_boundary && near(x[2], ez, tol)", tol=fenics.DOLFIN_EPS, ez=end_z
+
+    n = int(n)
+    size_min = np.min(sizes)
+    num_points = tuple(int(np.round(length / size_min * n)) for length in sizes)
+
+    if comm is None:
+        comm = fenics.MPI.comm_world
+
+    if comm != fenics.MPI.comm_world:
+        return regular_box_mesh.__wrapped__(  # type: ignore
+            n=n,
+            start_x=offset[0],
+            start_y=offset[1],
+            start_z=offset[2] if dim == 3 else None,
+            end_x=offset[0] + sizes[0],
+            end_y=offset[1] + sizes[1],
+            end_z=offset[2] + sizes[2] if dim == 3 else None,
+            diagonal=diagonal,
+            comm=comm,
         )
-        z_min.mark(boundaries, 5)
-        z_max.mark(boundaries, 6)
+
+    # the diagonal is not used in 3D, so it must not be part of the cache key
+    unit_diagonal = diagonal if dim == 2 else "right"
+    unit_mesh, unit_boundary_values = _unit_box_mesh(num_points, unit_diagonal)
+
+    mesh = fenics.Mesh(unit_mesh)
+    coordinates = mesh.coordinates()
+    coordinates *= np.asarray(sizes, dtype=float)
+    coordinates += np.asarray(offset, dtype=float)
+    mesh.bounding_box_tree().build(mesh)
+
+    subdomains = fenics.MeshFunction("size_t", mesh, dim=dim)
+    boundaries = fenics.MeshFunction("size_t", mesh, dim=dim - 1)
+    boundaries.array()[:] = unit_boundary_values
 
     dx = measure.NamedMeasure("dx", mesh, subdomain_data=subdomains)
     ds = measure.NamedMeasure("ds", mesh, subdomain_data=boundaries)
@@ -492,6 +556,50 @@ def regular_box_mesh(
     return mesh, subdomains, boundaries, dx, ds, d_interior_facet
 
 
+@functools.lru_cache(maxsize=8)
+def _unit_box_mesh(
+    num_points: Tuple[int, ...], diagonal: str
+) -> Tuple[fenics.Mesh, np.ndarray]:
+    """Creates a (cached) mesh of the unit square or cube and its boundary markers.
+
+    Args:
+        num_points: The number of elements in each coordinate direction.
+        diagonal: The type of diagonal used for the mesh in 2D.
+
+    Returns:
+        A tuple (mesh, boundary_values), where mesh is the mesh of the unit square
+        or cube and boundary_values are the boundary markers of its facets.
+
+    """
+    comm = fenics.MPI.comm_world
+    dim = len(num_points)
+
+    if dim == 2:
+        mesh = fenics.RectangleMesh(
+            comm,
+            fenics.Point(0.0, 0.0),
+            fenics.Point(1.0, 1.0),
+            num_points[0],
+            num_points[1],
+            diagonal=diagonal,
+        )
+    else:
+        mesh = fenics.BoxMesh(
+            comm,
+            fenics.Point(0.0, 0.0, 0.0),
+            fenics.Point(1.0, 1.0, 1.0),
+            num_points[0],
+            num_points[1],
+            num_points[2],
+        )
+
+    boundaries = fenics.MeshFunction("size_t", mesh, dim=dim - 1)
+    coordinates = np.asarray(mesh.coordinates())
+    _mark_box_boundaries(mesh, coordinates, boundaries, [0.0] * dim, [1.0] * dim)
+
+    return mesh, boundaries.array().copy()
+
+
 def _check_sizes(sizes: List[float]) -> None:
     for size in sizes:
         if size <= 0:
@@ -500,3 +608,46 @@ def _check_sizes(sizes: List[float]) -> None:
                 "start_",
                 "The start values have to be smaller than the end values.",
             )
+
+
+def _mark_box_boundaries(
+    mesh: fenics.Mesh,
+    coordinates: np.ndarray,
+    boundaries: fenics.MeshFunction,
+    starts: List[float],
+    ends: List[float],
+) -> None:
+    """Marks the boundaries of a structured box mesh.
+
+    As the mesh is an axis-aligned box, a facet belongs to one of its sides if and
+    only if all of its vertices lie on the corresponding plane. This is checked
+    directly with the facet-vertex connectivity instead of evaluating one
+    :py:class:`fenics.CompiledSubDomain` per side. The markers are 1 and 2 for the
+    start and end in x-direction, 3 and 4 for the y-direction, and 5 and 6 for the
+    z-direction.
+
+    Args:
+        mesh: The structured box mesh.
+        coordinates: The (local) coordinates of the mesh vertices, i.e., a view
+            obtained from ``mesh.coordinates()``.
+        boundaries: The mesh function for the facets, which is marked in-place.
+        starts: The start coordinates of the box in each direction.
+        ends: The end coordinates of the box in each direction.
+
+    """
+    dim = mesh.topology().dim()
+    mesh.init(dim - 1, 0)
+    facets = mesh.topology()(dim - 1, 0)().reshape(-1, dim)
+    facet_coordinates = coordinates[facets]
+
+    thresholds = np.column_stack((starts, ends)).ravel()
+    axes = np.repeat(np.arange(dim), 2)
+    masks = np.all(
+        np.abs(facet_coordinates[:, :, axes] - thresholds) <= _DOLFIN_EPS,
+        axis=1,
+    ).T
+
+    values = boundaries.array()
+    values[:] = 0
+    for k in range(2 * dim):
+        values[masks[k]] = k + 1
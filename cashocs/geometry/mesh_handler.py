@@ -20,14 +20,19 @@
 
 from __future__ import annotations
 
+import functools
+import math
+import mmap
+import os
 import pathlib
+import re
+import shutil
 import subprocess  # nosec B404
 import tempfile
-from typing import List, TYPE_CHECKING
+from typing import List, Tuple, TYPE_CHECKING
 import weakref
 
 import fenics
-import numpy as np
 
 from cashocs import _exceptions
 from cashocs import _loggers
@@ -40,11 +45,46 @@ from cashocs.io.mesh import import_mesh
 
 if TYPE_CHECKING:
     from cashocs import _forms
-    from cashocs import _typing
     from cashocs._database import database
     from cashocs._optimization.optimization_algorithms import OptimizationAlgorithm
     from cashocs.geometry import mesh_testing
 
+# lines of the original .geo file which are kept for remeshing: definitions of
+# variables (lowercase), mesh size fields, and mesh options
+_REMESH_GEO_PATTERN = re.compile(
+    rb"(?m)^(?:[a-z]|Field|Background Field|BoundaryLayer Field|Mesh\.)"
+    rb"[^\n]*(?:\n|\Z)"
+)
+
+
+def _find_gmsh_parametrizations(content: mmap.mmap) -> List[Tuple[int, int]]:
+    """Finds the byte ranges of the parametrizations sections of a Gmsh file.
+
+    Args:
+        content: The (memory mapped) content of the Gmsh file.
+
+    Returns:
+        A list of tuples (start, end), so that ``content[start:end]`` is a
+        parametrizations section, including its start and end tags.
+
+    """
+    start_tag = b"\n$Parametrizations\n"
+    end_tag = b"\n$EndParametrizations\n"
+
+    sections = []
+    # the tags are searched including the preceding newline, so that only complete
+    # lines are matched without inspecting any of the found positions
+    at_beginning = content[: len(start_tag) - 1] == start_tag[1:]
+    start = -1 if at_beginning else content.find(start_tag)
+    while at_beginning or start != -1:
+        at_beginning = False
+        end = content.find(end_tag, start + len(start_tag) - 1)
+        end = len(content) if end == -1 else end + len(end_tag)
+        sections.append((start + 1, end))
+        start = content.find(start_tag, end - 1)
+
+    return sections
+
 
 def _remove_gmsh_parametrizations(mesh_file: str) -> None:
     """Removes the parametrizations section from a Gmsh file.
@@ -56,26 +96,47 @@ def _remove_gmsh_parametrizations(mesh_file: str) -> None:
 
     """
     temp_location = f"{mesh_file[:-4]}_temp.msh"
-    if fenics.MPI.rank(fenics.MPI.comm_world) == 0:
-        with open(mesh_file, "r", encoding="utf-8") as in_file, open(
-            temp_location, "w", encoding="utf-8"
-        ) as temp_file:
-            parametrizations_section = False
-
-            for line in in_file:
-                if line == "$Parametrizations\n":
-                    parametrizations_section = True
-
-                if not parametrizations_section:
-                    temp_file.write(line)
-                else:
-                    pass
+    if fenics.MPI.rank(fenics.MPI.comm_world) == 0 and os.path.getsize(mesh_file) > 0:
+        with open(mesh_file, "rb") as in_file, mmap.mmap(
+            in_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as content:
+            sections = _find_gmsh_parametrizations(content)
+
+            if sections:
+                with open(temp_location, "wb") as temp_file, memoryview(
+                    content
+                ) as view:
+                    position = 0
+                    for start, end in sections:
+                        temp_file.write(view[position:start])
+                        position = end
+                    temp_file.write(view[position:])
+
+        if sections:
+            os.replace(temp_location, mesh_file)
+    fenics.MPI.barrier(fenics.MPI.comm_world)
 
-                if line == "$EndParametrizations\n":
-                    parametrizations_section = False
 
-        subprocess.run(["mv", temp_location, mesh_file], check=True)  # nosec B603, B607
-    fenics.MPI.barrier(fenics.MPI.comm_world)
+def _run_gmsh(gmsh_cmd_list: List[str], show_output: bool) -> None:
+    """Runs Gmsh as subprocess and waits for it to finish.
+
+    The process is started without closing the file descriptors of the parent, so
+    that it can be launched via posix_spawn instead of fork and exec.
+
+    Args:
+        gmsh_cmd_list: The command for Gmsh, including all arguments.
+        show_output: A boolean flag, which indicates whether the output of Gmsh is
+            shown.
+
+    """
+    stdout = None if show_output else subprocess.DEVNULL
+    with subprocess.Popen(  # nosec 603
+        gmsh_cmd_list, stdout=stdout, close_fds=False
+    ) as process:
+        return_code = process.wait()
+
+    if return_code != 0:
+        raise subprocess.CalledProcessError(return_code, gmsh_cmd_list)
 
 
 def check_mesh_quality_tolerance(mesh_quality: float, tolerance: float) -> None:
@@ -131,9 +192,6 @@ class _MeshHandler:
 
         # Namespacing
         self.mesh = self.db.geometry_db.mesh
-        self.deformation_handler = deformations.DeformationHandler(
-            self.mesh, self.a_priori_tester, self.a_posteriori_tester
-        )
         self.dx = self.db.geometry_db.dx
         self.bbtree = self.mesh.bounding_box_tree()
         self.config = self.db.config
@@ -165,56 +223,40 @@ class _MeshHandler:
 
         self.mesh_quality_type = self.config.get("MeshQuality", "type")
 
+        self.beta_armijo = self.config.getfloat("LineSearch", "beta_armijo")
+        self.line_search_type = self.config.get("LineSearch", "method").casefold()
+        self.global_deformation = self.config.getboolean(
+            "ShapeGradient", "global_deformation"
+        )
+
         self.current_mesh_quality: float = quality.compute_mesh_quality(
             self.mesh, self.mesh_quality_type, self.mesh_quality_measure
         )
+        self._previous_mesh_quality = self.current_mesh_quality
 
         if not self.db.parameter_db.is_remeshed:
             check_mesh_quality_tolerance(
                 self.current_mesh_quality, self.mesh_quality_tol_upper
             )
 
-        self.options_frobenius: _typing.KspOption = {
-            "ksp_type": "preonly",
-            "pc_type": "jacobi",
-            "pc_jacobi_type": "diagonal",
-            "ksp_rtol": 1e-16,
-            "ksp_atol": 1e-20,
-            "ksp_max_it": 1000,
-        }
-        self.trial_dg0 = fenics.TrialFunction(self.db.function_db.dg_function_space)
-        self.test_dg0 = fenics.TestFunction(self.db.function_db.dg_function_space)
-        self.search_direction_container = fenics.Function(
-            self.db.function_db.control_spaces[0]
-        )
-        self.a_frobenius = None
+        # the decrease computation is only set up when it is needed for the first time
         self.l_frobenius = None
-
-        self._setup_decrease_computation()
-
-        self.options_prior: _typing.KspOption = {
-            "ksp_type": "preonly",
-            "pc_type": "jacobi",
-            "pc_jacobi_type": "diagonal",
-            "ksp_rtol": 1e-16,
-            "ksp_atol": 1e-20,
-            "ksp_max_it": 1000,
-        }
-        self.transformation_container = fenics.Function(
-            self.db.function_db.control_spaces[0]
-        )
-        self.A_prior = None  # pylint: disable=invalid-name
-        self.l_prior = None
+        self.b_frobenius = fenics.PETScVector()
 
         # Remeshing initializations
         self.do_remesh: bool = self.config.getboolean("Mesh", "remesh")
         self.save_optimized_mesh: bool = self.config.getboolean("Output", "save_mesh")
+        self.show_gmsh_output: bool = self.config.getboolean("Mesh", "show_gmsh_output")
 
         if self.do_remesh or self.save_optimized_mesh:
             self.mesh_directory = (
                 pathlib.Path(self.config.get("Mesh", "gmsh_file")).resolve().parent
             )
 
+        if self.do_remesh:
+            # an absolute path allows the subprocess to be launched via posix_spawn
+            self.gmsh_executable = shutil.which("gmsh") or "gmsh"
+
         self._setup_remesh()
 
     def _setup_remesh(self) -> None:
@@ -256,12 +298,17 @@ class _MeshHandler:
                 f"/mesh_{self.remesh_counter:d}.msh"
             )
             if fenics.MPI.rank(fenics.MPI.comm_world) == 0:
-                subprocess.run(  # nosec 603
-                    ["cp", self.gmsh_file, self.gmsh_file_init], check=True
-                )
+                shutil.copyfile(self.gmsh_file, self.gmsh_file_init)
             fenics.MPI.barrier(fenics.MPI.comm_world)
             self.gmsh_file = self.gmsh_file_init
 
+    @functools.cached_property
+    def deformation_handler(self) -> deformations.DeformationHandler:
+        """The handler for the mesh deformations, created when it is first used."""
+        return deformations.DeformationHandler(
+            self.mesh, self.a_priori_tester, self.a_posteriori_tester
+        )
+
     @property
     def current_mesh_quality(self) -> float:
         """The current mesh quality."""
@@ -310,9 +357,12 @@ class _MeshHandler:
                 validated_a_priori=True,
                 test_for_intersections=self.test_for_intersections,
             )
-            self.current_mesh_quality = quality.compute_mesh_quality(
-                self.mesh, self.mesh_quality_type, self.mesh_quality_measure
-            )
+            # a failed movement is reverted, so that the quality is unchanged
+            if success_flag:
+                self._previous_mesh_quality = self.current_mesh_quality
+                self.current_mesh_quality = quality.compute_mesh_quality(
+                    self.mesh, self.mesh_quality_type, self.mesh_quality_measure
+                )
             return success_flag
 
     def revert_transformation(self) -> None:
@@ -323,21 +373,34 @@ class _MeshHandler:
         to lack of sufficient decrease in the Armijo rule
         """
         self.deformation_handler.revert_transformation()
+        self.current_mesh_quality = self._previous_mesh_quality
 
     def _setup_decrease_computation(self) -> None:
-        """Initializes attributes and solver for the frobenius norm check."""
-        if self.angle_change != float("inf"):
-            self.a_frobenius = self.trial_dg0 * self.test_dg0 * self.dx
-            self.l_frobenius = (
-                fenics.sqrt(
-                    fenics.inner(
-                        fenics.grad(self.search_direction_container),
-                        fenics.grad(self.search_direction_container),
-                    )
+        """Initializes attributes for the frobenius norm check.
+
+        As the norm is projected onto piecewise constant functions, the mass matrix
+        is diagonal with the cell volumes as entries. Hence, the projection is
+        computed directly by dividing the integrand by the cell volume, so that no
+        linear system has to be assembled and solved. The form is compiled once here
+        and reused for every assembly.
+        """
+        self.inverse_log_beta_armijo = 1.0 / math.log(1.0 / self.beta_armijo)
+
+        self.test_dg0 = fenics.TestFunction(self.db.function_db.dg_function_space)
+        self.search_direction_container = fenics.Function(
+            self.db.function_db.control_spaces[0]
+        )
+        self.l_frobenius = fenics.Form(
+            fenics.sqrt(
+                fenics.inner(
+                    fenics.grad(self.search_direction_container),
+                    fenics.grad(self.search_direction_container),
                 )
-                * self.test_dg0
-                * self.dx
             )
+            / fenics.CellVolume(self.mesh)
+            * self.test_dg0
+            * self.dx
+        )
 
     def compute_decreases(
         self, search_direction: List[fenics.Function], stepsize: float
@@ -365,28 +428,23 @@ class _MeshHandler:
             return 0
 
         else:
-            self.search_direction_container.vector().vec().aypx(
-                0.0, search_direction[0].vector().vec()
+            if self.l_frobenius is None:
+                self._setup_decrease_computation()
+
+            search_direction[0].vector().vec().copy(
+                self.search_direction_container.vector().vec()
             )
             self.search_direction_container.vector().apply("")
-            x = _utils.assemble_and_solve_linear(
-                self.a_frobenius,
-                self.l_frobenius,
-                ksp_options=self.options_frobenius,
-                comm=self.db.geometry_db.mpi_comm,
-            )
+            fenics.assemble(self.l_frobenius, tensor=self.b_frobenius)
 
-            frobenius_norm = x.max()[1]
-            beta_armijo = self.config.getfloat("LineSearch", "beta_armijo")
+            frobenius_norm = self.b_frobenius.vec().max()[1]
 
-            return int(
-                np.maximum(
-                    np.ceil(
-                        np.log(self.angle_change / stepsize / frobenius_norm)
-                        / np.log(1 / beta_armijo)
-                    ),
-                    0.0,
-                )
+            return max(
+                math.ceil(
+                    math.log(self.angle_change / stepsize / frobenius_norm)
+                    * self.inverse_log_beta_armijo
+                ),
+                0,
             )
 
     def _generate_remesh_geo(self, input_mesh_file: str) -> None:
@@ -409,108 +467,36 @@ class _MeshHandler:
                 file.write("\n")
 
                 geo_file = self.db.parameter_db.temp_dict["geo_file"]
-                with open(geo_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        if line[0].islower():
-                            file.write(line)
-                        if line[:5] == "Field":
-                            file.write(line)
-                        if line[:16] == "Background Field":
-                            file.write(line)
-                        if line[:19] == "BoundaryLayer Field":
-                            file.write(line)
-                        if line[:5] == "Mesh.":
-                            file.write(line)
+                if os.path.getsize(geo_file) > 0:
+                    with open(geo_file, "rb") as f, mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as content:
+                        file.write(
+                            b"".join(_REMESH_GEO_PATTERN.findall(content)).decode(
+                                "utf-8"
+                            )
+                        )
 
         fenics.MPI.barrier(fenics.MPI.comm_world)
 
     def clean_previous_gmsh_files(self) -> None:
         """Removes the gmsh files from the previous remeshing iterations."""
-        gmsh_file = (
-            f"{self.db.parameter_db.remesh_directory}"
-            f"/mesh_{self.remesh_counter - 1:d}.msh"
-        )
-        if (
-            pathlib.Path(gmsh_file).is_file()
-            and fenics.MPI.rank(fenics.MPI.comm_world) == 0
-        ):
-            subprocess.run(["rm", gmsh_file], check=True)  # nosec 603
-        fenics.MPI.barrier(fenics.MPI.comm_world)
-
-        gmsh_pre_remesh_file = (
-            f"{self.db.parameter_db.remesh_directory}"
-            f"/mesh_{self.remesh_counter-1:d}_pre_remesh.msh"
-        )
-        if (
-            pathlib.Path(gmsh_pre_remesh_file).is_file()
-            and fenics.MPI.rank(fenics.MPI.comm_world) == 0
-        ):
-            subprocess.run(["rm", gmsh_pre_remesh_file], check=True)  # nosec 603
-        fenics.MPI.barrier(fenics.MPI.comm_world)
-
-        mesh_h5_file = (
-            f"{self.db.parameter_db.remesh_directory}/mesh_{self.remesh_counter-1:d}.h5"
-        )
-        if (
-            pathlib.Path(mesh_h5_file).is_file()
-            and fenics.MPI.rank(fenics.MPI.comm_world) == 0
-        ):
-            subprocess.run(["rm", mesh_h5_file], check=True)  # nosec 603
-        fenics.MPI.barrier(fenics.MPI.comm_world)
-
-        mesh_xdmf_file = (
-            f"{self.db.parameter_db.remesh_directory}"
-            f"/mesh_{self.remesh_counter-1:d}.xdmf"
-        )
-        if (
-            pathlib.Path(mesh_xdmf_file).is_file()
-            and fenics.MPI.rank(fenics.MPI.comm_world) == 0
-        ):
-            subprocess.run(["rm", mesh_xdmf_file], check=True)  # nosec 603
-        fenics.MPI.barrier(fenics.MPI.comm_world)
-
-        boundaries_h5_file = (
-            f"{self.db.parameter_db.remesh_directory}"
-            f"/mesh_{self.remesh_counter-1:d}_boundaries.h5"
-        )
-        if (
-            pathlib.Path(boundaries_h5_file).is_file()
-            and fenics.MPI.rank(fenics.MPI.comm_world) == 0
-        ):
-            subprocess.run(["rm", boundaries_h5_file], check=True)  # nosec 603
-        fenics.MPI.barrier(fenics.MPI.comm_world)
-
-        boundaries_xdmf_file = (
-            f"{self.db.parameter_db.remesh_directory}"
-            f"/mesh_{self.remesh_counter-1:d}_boundaries.xdmf"
-        )
-        if (
-            pathlib.Path(boundaries_xdmf_file).is_file()
-            and fenics.MPI.rank(fenics.MPI.comm_world) == 0
-        ):
-            subprocess.run(["rm", boundaries_xdmf_file], check=True)  # nosec 603
-        fenics.MPI.barrier(fenics.MPI.comm_world)
-
-        subdomains_h5_file = (
-            f"{self.db.parameter_db.remesh_directory}"
-            f"/mesh_{self.remesh_counter-1:d}_subdomains.h5"
-        )
-        if (
-            pathlib.Path(subdomains_h5_file).is_file()
-            and fenics.MPI.rank(fenics.MPI.comm_world) == 0
-        ):
-            subprocess.run(["rm", subdomains_h5_file], check=True)  # nosec 603
-        fenics.MPI.barrier(fenics.MPI.comm_world)
-
-        subdomains_xdmf_file = (
-            f"{self.db.parameter_db.remesh_directory}"
-            f"/mesh_{self.remesh_counter-1:d}_subdomains.xdmf"
-        )
-        if (
-            pathlib.Path(subdomains_xdmf_file).is_file()
-            and fenics.MPI.rank(fenics.MPI.comm_world) == 0
-        ):
-            subprocess.run(["rm", subdomains_xdmf_file], check=True)  # nosec 603
+        if fenics.MPI.rank(fenics.MPI.comm_world) == 0:
+            file_prefix = (
+                f"{self.db.parameter_db.remesh_directory}"
+                f"/mesh_{self.remesh_counter - 1:d}"
+            )
+            for suffix in [
+                ".msh",
+                "_pre_remesh.msh",
+                ".h5",
+                ".xdmf",
+                "_boundaries.h5",
+                "_boundaries.xdmf",
+                "_subdomains.h5",
+                "_subdomains.xdmf",
+            ]:
+                pathlib.Path(f"{file_prefix}{suffix}").unlink(missing_ok=True)
         fenics.MPI.barrier(fenics.MPI.comm_world)
 
     def _reinitialize(self, solver: OptimizationAlgorithm) -> None:
@@ -520,12 +506,11 @@ class _MeshHandler:
         )
         solver.optimization_problem.initialize_solve_parameters()
 
-        line_search_type = self.config.get("LineSearch", "method").casefold()
-        if line_search_type == "armijo":
+        if self.line_search_type == "armijo":
             line_search: ls.LineSearch = ls.ArmijoLineSearch(
                 self.db, solver.optimization_problem
             )
-        elif line_search_type == "polynomial":
+        elif self.line_search_type == "polynomial":
             line_search = ls.PolynomialLineSearch(self.db, solver.optimization_problem)
         else:
             raise _exceptions.CashocsException("This code cannot be reached.")
@@ -572,22 +557,24 @@ class _MeshHandler:
                 solver.iteration + 1
             )
 
+            # the history lists are handed over without copying them, as the current
+            # output manager is replaced during the reinitialization
             output_dict = solver.output_manager.output_dict
             self.db.parameter_db.temp_dict["output_dict"]["cost_function_value"] = (
-                output_dict["cost_function_value"][:]
+                output_dict["cost_function_value"]
             )
             self.db.parameter_db.temp_dict["output_dict"]["gradient_norm"] = (
-                output_dict["gradient_norm"][:]
+                output_dict["gradient_norm"]
             )
             self.db.parameter_db.temp_dict["output_dict"]["stepsize"] = output_dict[
                 "stepsize"
-            ][:]
+            ]
             self.db.parameter_db.temp_dict["output_dict"]["MeshQuality"] = output_dict[
                 "MeshQuality"
-            ][:]
+            ]
             self.db.parameter_db.temp_dict["output_dict"]["angle"] = output_dict[
                 "angle"
-            ][:]
+            ]
 
             self.db.parameter_db.temp_dict["OptimizationRoutine"]["rtol"] = (
                 self.config.getfloat("OptimizationRoutine", "rtol")
@@ -607,21 +594,14 @@ class _MeshHandler:
             )
 
             gmsh_cmd_list = [
-                "gmsh",
+                self.gmsh_executable,
                 self.remesh_geo_file,
                 f"-{int(dim):d}",
                 "-o",
                 new_gmsh_file,
             ]
             if fenics.MPI.rank(fenics.MPI.comm_world) == 0:
-                if not self.config.getboolean("Mesh", "show_gmsh_output"):
-                    subprocess.run(  # nosec 603
-                        gmsh_cmd_list,
-                        check=True,
-                        stdout=subprocess.DEVNULL,
-                    )
-                else:
-                    subprocess.run(gmsh_cmd_list, check=True)  # nosec 603
+                _run_gmsh(gmsh_cmd_list, self.show_gmsh_output)
             fenics.MPI.barrier(fenics.MPI.comm_world)
 
             _remove_gmsh_parametrizations(new_gmsh_file)
@@ -655,6 +635,11 @@ class _MeshHandler:
 
             self._update_mesh_transfer_matrix(new_xdmf_file, solver)
 
+            # the output manager and the solvers are replaced during the
+            # reinitialization
+            solver.output_manager.close()
+            solver.state_problem.destroy()
+            solver.gradient_problem.destroy()
             self._reinitialize(solver)
             self._check_imported_mesh_quality(solver)
             return True
@@ -672,28 +657,22 @@ class _MeshHandler:
             solver: The solver instance carrying the new mesh
 
         """
-        mesh_quality_tol_lower = self.db.config.getfloat("MeshQuality", "tol_lower")
-        mesh_quality_tol_upper = self.db.config.getfloat("MeshQuality", "tol_upper")
-
-        if mesh_quality_tol_lower > 0.9 * mesh_quality_tol_upper:
+        if self.mesh_quality_tol_lower > 0.9 * self.mesh_quality_tol_upper:
             _loggers.warning(
                 "You are using a lower remesh tolerance (tol_lower) close to "
                 "the upper one (tol_upper). This may slow down the "
                 "optimization considerably."
             )
 
-        mesh_quality_measure = self.db.config.get("MeshQuality", "measure")
-        mesh_quality_type = self.db.config.get("MeshQuality", "type")
-
         mesh = solver.optimization_problem.states[0].function_space().mesh()
 
         current_mesh_quality = quality.compute_mesh_quality(
             mesh,
-            mesh_quality_type,
-            mesh_quality_measure,
+            self.mesh_quality_type,
+            self.mesh_quality_measure,
         )
 
-        check_mesh_quality_tolerance(current_mesh_quality, mesh_quality_tol_upper)
+        check_mesh_quality_tolerance(current_mesh_quality, self.mesh_quality_tol_upper)
 
     def _update_mesh_transfer_matrix(
         self, xdmf_filename: str, solver: OptimizationAlgorithm
@@ -705,7 +684,7 @@ class _MeshHandler:
             solver: The optimization algorithm.
 
         """
-        if self.config.getboolean("ShapeGradient", "global_deformation"):
+        if self.global_deformation:
             pre_log_level = (
                 _loggers._cashocs_logger.level  # pylint: disable=protected-access
             )
@@ -720,9 +699,7 @@ class _MeshHandler:
             new_transfer_matrix = self.db.geometry_db.transfer_matrix.matMult(
                 interpolator.transfer_matrix
             )
-            self.db.parameter_db.temp_dict["transfer_matrix"] = (
-                new_transfer_matrix.copy()
-            )
+            self.db.parameter_db.temp_dict["transfer_matrix"] = new_transfer_matrix
             self.db.parameter_db.temp_dict["old_transfer_matrix"] = (
                 self.db.geometry_db.transfer_matrix.copy()
             )
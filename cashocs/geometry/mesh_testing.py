@@ -20,16 +20,12 @@
 from __future__ import annotations
 
 import collections
-from typing import TYPE_CHECKING
 
 import fenics
+from mpi4py import MPI
 import numpy as np
 
 from cashocs import _loggers
-from cashocs import _utils
-
-if TYPE_CHECKING:
-    from cashocs import _typing
 
 
 class APrioriMeshTester:
@@ -43,35 +39,63 @@ class APrioriMeshTester:
 
         """
         self.mesh = mesh
+        self.comm = self.mesh.mpi_comm()
+
+        dim = self.mesh.topology().dim()
+        self.is_full_dimensional = dim == self.mesh.geometric_dimension()
+        # the topology is fixed and the coordinates are only modified in-place, so
+        # that both arrays stay valid when the mesh is moved
+        self.cells = self.mesh.cells()[: self.mesh.topology().ghost_offset(dim)]
+        self.coordinates = self.mesh.coordinates()
+
+        if not self.is_full_dimensional:
+            dg_function_space = fenics.FunctionSpace(self.mesh, "DG", 0)
+            vector_cg_space = fenics.VectorFunctionSpace(self.mesh, "CG", 1)
+            dx = fenics.Measure("dx", domain=mesh)
+
+            self.transformation_container = fenics.Function(vector_cg_space)
+
+            # the projection onto DG0 is computed by dividing by the cell volume, as
+            # the corresponding mass matrix is diagonal. The form is compiled once,
+            # so that it does not have to be wrapped again for each assembly
+            self.l_prior = fenics.Form(
+                fenics.det(
+                    fenics.Identity(self.mesh.geometric_dimension())
+                    + fenics.grad(self.transformation_container)
+                )
+                / fenics.CellVolume(self.mesh)
+                * fenics.TestFunction(dg_function_space)
+                * dx
+            )
+            self.b_prior = fenics.PETScVector()
 
-        dg_function_space = fenics.FunctionSpace(self.mesh, "DG", 0)
-        vector_cg_space = fenics.VectorFunctionSpace(self.mesh, "CG", 1)
-        dx = fenics.Measure("dx", domain=mesh)
+    def _compute_determinants(self, transformation: fenics.Function) -> np.ndarray:
+        r"""Computes :math:`\det(I + D \texttt{transformation})` for all local cells.
 
-        self.transformation_container = fenics.Function(vector_cg_space)
+        For a piecewise linear transformation, the Jacobian is constant on each
+        simplex, so that the determinant is the ratio of the signed volumes of the
+        transformed and the original cell. This is computed directly from the
+        vertex coordinates, without any assembly.
 
-        # pylint: disable=invalid-name
-        self.A_prior = (
-            fenics.TrialFunction(dg_function_space)
-            * fenics.TestFunction(dg_function_space)
-            * dx
-        )
-        self.l_prior = (
-            fenics.det(
-                fenics.Identity(self.mesh.geometric_dimension())
-                + fenics.grad(self.transformation_container)
-            )
-            * fenics.TestFunction(dg_function_space)
-            * dx
-        )
-        self.options_prior: _typing.KspOption = {
-            "ksp_type": "preonly",
-            "pc_type": "jacobi",
-            "pc_jacobi_type": "diagonal",
-            "ksp_rtol": 1e-16,
-            "ksp_atol": 1e-20,
-            "ksp_max_it": 1000,
-        }
+        Args:
+            transformation: The transformation for the mesh.
+
+        Returns:
+            The determinants for all cells owned by this process.
+
+        """
+        dim = self.mesh.geometric_dimension()
+        vertex_values = transformation.compute_vertex_values(self.mesh)
+        vertex_values = vertex_values.reshape(dim, -1).T
+
+        cell_coordinates = self.coordinates[self.cells]
+        cell_values = vertex_values[self.cells]
+
+        edges = cell_coordinates[:, 1:] - cell_coordinates[:, :1]
+        deformed_edges = edges + cell_values[:, 1:] - cell_values[:, :1]
+
+        determinants: np.ndarray = np.linalg.det(deformed_edges) / np.linalg.det(edges)
+        return determinants
 
     def test(self, transformation: fenics.Function, volume_change: float) -> bool:
         r"""Check the quality of the transformation before the actual mesh is moved.
@@ -92,17 +116,26 @@ class APrioriMeshTester:
             A boolean that indicates whether the desired transformation is feasible.
 
         """
-        comm = self.transformation_container.function_space().mesh().mpi_comm()
-        self.transformation_container.vector().vec().aypx(
-            0.0, transformation.vector().vec()
-        )
-        self.transformation_container.vector().apply("")
-        x = _utils.assemble_and_solve_linear(
-            self.A_prior, self.l_prior, ksp_options=self.options_prior, comm=comm
-        )
+        if self.is_full_dimensional:
+            determinants = self._compute_determinants(transformation)
+            if determinants.size > 0:
+                local_min = float(determinants.min())
+                local_max = float(determinants.max())
+            else:
+                local_min = float("inf")
+                local_max = -float("inf")
+            min_det = self.comm.allreduce(local_min, op=MPI.MIN)
+            max_det = self.comm.allreduce(local_max, op=MPI.MAX)
+        else:
+            transformation.vector().vec().copy(
+                self.transformation_container.vector().vec()
+            )
+            self.transformation_container.vector().apply("")
+            fenics.assemble(self.l_prior, tensor=self.b_prior)
+            x = self.b_prior.vec()
 
-        min_det = float(x.min()[1])
-        max_det = float(x.max()[1])
+            min_det = float(x.min()[1])
+            max_det = float(x.max()[1])
 
         return bool((min_det >= 1 / volume_change) and (max_det <= volume_change))
 
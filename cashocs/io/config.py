@@ -532,6 +532,10 @@ class Config(ConfigParser):
                 "save_results": {
                     "type": "bool",
                 },
+                "history_format": {
+                    "type": "str",
+                    "possible_options": ["json", "npz"],
+                },
                 "save_txt": {
                     "type": "bool",
                 },
@@ -544,6 +548,10 @@ class Config(ConfigParser):
                 "save_gradient": {
                     "type": "bool",
                 },
+                "flush_every": {
+                    "type": "int",
+                    "attributes": ["positive"],
+                },
                 "save_mesh": {
                     "type": "bool",
                     "requires": [("Mesh", "gmsh_file")],
@@ -701,11 +709,13 @@ topological_derivative_is_identical = False
 
 [Output]
 save_results = True
+history_format = json
 verbose = True
 save_txt = True
 save_state = False
 save_adjoint = False
 save_gradient = False
+flush_every = 10
 save_mesh = False
 result_dir = ./results
 precision = 3
@@ -20,17 +20,20 @@
 from __future__ import annotations
 
 import abc
+import functools
 import json
 import os
 import shutil
-import subprocess  # nosec B404
-from typing import cast, List, TYPE_CHECKING, Union
+from typing import cast, Dict, IO, List, Optional, Tuple, TYPE_CHECKING, Union
 
 import fenics
+import numpy as np
 
 from cashocs.io import mesh as iomesh
 
 if TYPE_CHECKING:
+    from mpi4py import MPI
+
     from cashocs._database import database
 
 
@@ -46,22 +49,53 @@ def generate_summary_str(db: database.Database, precision: int) -> str:
 
     """
     optimization_state = db.parameter_db.optimization_state
-    strs = [
-        "\n",
-        "Optimization was successful.\n",
-        "Statistics:\n",
-        f"    total iterations: {optimization_state['iteration']:4d}\n",
+
+    return (
+        "\nOptimization was successful.\n"
+        "Statistics:\n"
+        f"    total iterations: {optimization_state['iteration']:4d}\n"
         "    final objective value: "
-        f"{optimization_state['objective_value']:>10.{precision}e}\n",
+        f"{optimization_state['objective_value']:>10.{precision}e}\n"
         "    final gradient norm:   "
-        f"{optimization_state['relative_norm']:>10.{precision}e}\n",
+        f"{optimization_state['relative_norm']:>10.{precision}e}\n"
         "    total number of state systems solved:   "
-        f"{optimization_state['no_state_solves']:4d}\n",
+        f"{optimization_state['no_state_solves']:4d}\n"
         "    total number of adjoint systems solved: "
-        f"{optimization_state['no_adjoint_solves']:4d}\n",
-    ]
+        f"{optimization_state['no_adjoint_solves']:4d}\n"
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _generate_header_str(gradient_str: str, problem_type: str, precision: int) -> str:
+    """Generates the header of the output, which is repeated every 10 iterations.
+
+    The header only depends on the arguments, so that it is generated only once.
+
+    Args:
+        gradient_str: The name of the displayed gradient norm.
+        problem_type: The type of the optimization problem.
+        precision: The precision used for displaying the numbers.
+
+    Returns:
+        The header string.
 
-    return "".join(strs)
+    """
+    header_width = max(len(gradient_str) + 7, precision + 9)
+    mesh_quality_header = ""
+    if problem_type == "shape":
+        mesh_quality_header = "mesh qlty,  ".rjust(max(12, precision + 9))
+    angle_header = ""
+    if problem_type == "topology":
+        angle_header = "angle,  ".rjust(max(10, precision + 7))
+
+    return (
+        "\niter,  "
+        f"{'cost function,  ':>{max(16, precision + 10)}}"
+        f"{f'rel. {gradient_str},  ':>{header_width}}"
+        f"{f'abs. {gradient_str},  ':>{header_width}}"
+        f"{mesh_quality_header}{angle_header}"
+        f"{'step size':>{max(9, precision + 6)}}\n\n"
+    )
 
 
 def generate_output_str(db: database.Database, precision: int) -> str:
@@ -75,55 +109,46 @@ def generate_output_str(db: database.Database, precision: int) -> str:
         The output string, which is used later.
 
     """
-    optimization_state = db.parameter_db.optimization_state
+    parameter_db = db.parameter_db
+    optimization_state = parameter_db.optimization_state
+    problem_type = parameter_db.problem_type
+    is_topology_problem = problem_type == "topology"
 
     iteration = optimization_state["iteration"]
     objective_value = optimization_state["objective_value"]
 
-    if not db.parameter_db.display_box_constraints:
+    if not parameter_db.display_box_constraints:
         gradient_str = "grad. norm"
     else:
         gradient_str = "stat. meas."
+    gradient_width = len(gradient_str) + 5
 
-    if db.parameter_db.problem_type == "shape":
-        mesh_quality = db.parameter_db.optimization_state["mesh_quality"]
+    if problem_type == "shape":
+        mesh_quality_str = f"{optimization_state['mesh_quality']:>9.{precision}e},  "
     else:
-        mesh_quality = None
+        mesh_quality_str = ""
+    if is_topology_problem:
+        angle_str = f"{optimization_state['angle']:>7.{precision}f},  "
+    else:
+        angle_str = ""
+    if iteration > 0:
+        stepsize_str = f"{optimization_state['stepsize']:>9.{precision}e}"
+    else:
+        stepsize_str = "\n"
 
     if iteration % 10 == 0:
-        info_list = [
-            "\niter,  ",
-            "cost function,  ".rjust(max(16, precision + 10)),
-            f"rel. {gradient_str},  ".rjust(max(len(gradient_str) + 7, precision + 9)),
-            f"abs. {gradient_str},  ".rjust(max(len(gradient_str) + 7, precision + 9)),
-        ]
-        if mesh_quality is not None:
-            info_list.append("mesh qlty,  ".rjust(max(12, precision + 9)))
-        if db.parameter_db.problem_type == "topology":
-            info_list.append("angle,  ".rjust(max(10, precision + 7)))
-        info_list.append("step size".rjust(max(9, precision + 6)))
-        info_list.append("\n\n")
-        info_str = "".join(info_list)
+        info_str = _generate_header_str(gradient_str, problem_type, precision)
     else:
         info_str = ""
 
-    strs = [
-        f"{iteration:4d},  ",
-        f"{objective_value:> 13.{precision}e},  ",
-        f"{optimization_state['relative_norm']:>{len(gradient_str)+5}.{precision}e},  ",
-        f"{optimization_state['gradient_norm']:>{len(gradient_str)+5}.{precision}e},  ",
-    ]
-    if mesh_quality is not None:
-        strs.append(f"{mesh_quality:>9.{precision}e},  ")
-    if db.parameter_db.problem_type == "topology":
-        strs.append(f"{db.parameter_db.optimization_state['angle']:>7.{precision}f},  ")
-
-    if iteration > 0:
-        strs.append(f"{optimization_state['stepsize']:>9.{precision}e}")
-    if iteration == 0:
-        strs.append("\n")
-
-    return info_str + "".join(strs)
+    return (
+        f"{info_str}"
+        f"{iteration:4d},  "
+        f"{objective_value:> 13.{precision}e},  "
+        f"{optimization_state['relative_norm']:>{gradient_width}.{precision}e},  "
+        f"{optimization_state['gradient_norm']:>{gradient_width}.{precision}e},  "
+        f"{mesh_quality_str}{angle_str}{stepsize_str}"
+    )
 
 
 class IOManager(abc.ABC):
@@ -141,6 +166,8 @@ class IOManager(abc.ABC):
         self.result_dir = result_dir
 
         self.config = self.db.config
+        self.comm = fenics.MPI.comm_world
+        self.is_root = fenics.MPI.rank(self.comm) == 0
 
     def output(self) -> None:
         """The output operation, which is performed after every iteration.
@@ -169,6 +196,10 @@ class IOManager(abc.ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Closes the files which are kept open by the manager."""
+        pass
+
 
 class ResultManager(IOManager):
     """Class for managing the output of the optimization history."""
@@ -184,56 +215,41 @@ class ResultManager(IOManager):
         super().__init__(db, result_dir)
 
         self.save_results = self.config.getboolean("Output", "save_results")
-
+        self.history_format = self.config.get("Output", "history_format")
+
+        history_keys = [
+            "cost_function_value",
+            "gradient_norm",
+            "stepsize",
+            "MeshQuality",
+            "angle",
+        ]
         self.output_dict = {}
         if self.db.parameter_db.temp_dict:
-            self.output_dict["cost_function_value"] = self.db.parameter_db.temp_dict[
-                "output_dict"
-            ]["cost_function_value"]
-            self.output_dict["gradient_norm"] = self.db.parameter_db.temp_dict[
-                "output_dict"
-            ]["gradient_norm"]
-            self.output_dict["stepsize"] = self.db.parameter_db.temp_dict[
-                "output_dict"
-            ]["stepsize"]
-            self.output_dict["MeshQuality"] = self.db.parameter_db.temp_dict[
-                "output_dict"
-            ]["MeshQuality"]
-            self.output_dict["angle"] = self.db.parameter_db.temp_dict["output_dict"][
-                "angle"
-            ]
+            temp_output_dict = self.db.parameter_db.temp_dict["output_dict"]
+            for key in history_keys:
+                self.output_dict[key] = temp_output_dict[key]
         else:
-            self.output_dict["cost_function_value"] = []
-            self.output_dict["gradient_norm"] = []
-            self.output_dict["stepsize"] = []
-            self.output_dict["MeshQuality"] = []
-            self.output_dict["angle"] = []
+            for key in history_keys:
+                self.output_dict[key] = []
 
     def output(self) -> None:
         """Saves the optimization history to a dictionary."""
+        optimization_state = self.db.parameter_db.optimization_state
+        problem_type = self.db.parameter_db.problem_type
+
         self.output_dict["cost_function_value"].append(
-            self.db.parameter_db.optimization_state["objective_value"]
-        )
-        self.output_dict["gradient_norm"].append(
-            self.db.parameter_db.optimization_state["relative_norm"]
-        )
-        if self.db.parameter_db.problem_type == "shape":
-            self.output_dict["MeshQuality"].append(
-                self.db.parameter_db.optimization_state["mesh_quality"]
-            )
-        if (
-            self.db.parameter_db.problem_type == "topology"
-            and self.db.config.getboolean("Output", "save_results")
-        ):
-            self.output_dict["angle"].append(
-                self.db.parameter_db.optimization_state["angle"]
-            )
-        self.output_dict["stepsize"].append(
-            self.db.parameter_db.optimization_state["stepsize"]
+            optimization_state["objective_value"]
         )
+        self.output_dict["gradient_norm"].append(optimization_state["relative_norm"])
+        if problem_type == "shape":
+            self.output_dict["MeshQuality"].append(optimization_state["mesh_quality"])
+        if problem_type == "topology" and self.save_results:
+            self.output_dict["angle"].append(optimization_state["angle"])
+        self.output_dict["stepsize"].append(optimization_state["stepsize"])
 
     def post_process(self) -> None:
-        """Saves the history of the optimization to a .json file."""
+        """Saves the history of the optimization to a .json or .npz file."""
         self.output_dict["initial_gradient_norm"] = (
             self.db.parameter_db.optimization_state["gradient_norm_initial"]
         )
@@ -246,10 +262,17 @@ class ResultManager(IOManager):
         self.output_dict["iterations"] = self.db.parameter_db.optimization_state[
             "iteration"
         ]
-        if self.save_results and fenics.MPI.rank(fenics.MPI.comm_world) == 0:
-            with open(f"{self.result_dir}/history.json", "w", encoding="utf-8") as file:
-                json.dump(self.output_dict, file, indent=4)
-        fenics.MPI.barrier(fenics.MPI.comm_world)
+        if self.save_results and self.is_root:
+            if self.history_format == "npz":
+                np.savez_compressed(
+                    f"{self.result_dir}/history.npz", **self.output_dict
+                )
+            else:
+                with open(
+                    f"{self.result_dir}/history.json", "w", encoding="utf-8"
+                ) as file:
+                    file.write(json.dumps(self.output_dict, indent=4))
+        fenics.MPI.barrier(self.comm)
 
 
 class ConsoleManager(IOManager):
@@ -266,17 +289,23 @@ class ConsoleManager(IOManager):
         super().__init__(db, result_dir)
         self.precision = self.config.getint("Output", "precision")
 
-    def output(self) -> None:
-        """Prints the output string to the console."""
-        if fenics.MPI.rank(fenics.MPI.comm_world) == 0:
-            print(generate_output_str(self.db, self.precision), flush=True)
-        fenics.MPI.barrier(fenics.MPI.comm_world)
+    def output(self, output_str: Optional[str] = None) -> None:
+        """Prints the output string to the console.
+
+        Args:
+            output_str: The output string of the current iteration. If this is
+                ``None``, the string is generated.
+
+        """
+        if self.is_root:
+            if output_str is None:
+                output_str = generate_output_str(self.db, self.precision)
+            print(output_str, flush=True)
 
     def output_summary(self) -> None:
         """Prints the summary in the console."""
-        if fenics.MPI.rank(fenics.MPI.comm_world) == 0:
+        if self.is_root:
             print(generate_summary_str(self.db, self.precision), flush=True)
-        fenics.MPI.barrier(fenics.MPI.comm_world)
 
 
 class FileManager(IOManager):
@@ -293,26 +322,81 @@ class FileManager(IOManager):
         super().__init__(db, result_dir)
         self.precision = self.config.getint("Output", "precision")
 
-    def output(self) -> None:
-        """Saves the output string in a file."""
-        if fenics.MPI.rank(fenics.MPI.comm_world) == 0:
-            if self.db.parameter_db.optimization_state["iteration"] == 0:
-                file_attr = "w"
-            else:
-                file_attr = "a"
+        # the history file is kept open between iterations and closed in the
+        # post-processing, the lines are buffered and written in batches of
+        # flush_every lines
+        self.file: Optional[IO[str]] = None
+        self.pending_lines: List[str] = []
+        self.flush_every = self.config.getint("Output", "flush_every")
+
+    def output(self, output_str: Optional[str] = None) -> None:
+        """Saves the output string in a file.
 
-            with open(
+        Args:
+            output_str: The output string of the current iteration. If this is
+                ``None``, the string is generated.
+
+        """
+        if self.is_root:
+            if output_str is None:
+                output_str = generate_output_str(self.db, self.precision)
+            iteration = self.db.parameter_db.optimization_state["iteration"]
+            if iteration == 0:
+                self.close()
+                self._open_file("w")
+
+            self.pending_lines.append(f"{output_str}\n")
+            if len(self.pending_lines) >= self.flush_every or (
+                iteration >= self.config.getint("OptimizationRoutine", "max_iter")
+            ):
+                self._write_pending_lines()
+
+    def _write_pending_lines(self) -> None:
+        """Writes the buffered lines to the history file and flushes it."""
+        if self.pending_lines:
+            file = self._open_file("a")
+            file.write("".join(self.pending_lines))
+            file.flush()
+            self.pending_lines.clear()
+
+    def _open_file(self, file_attr: str) -> IO[str]:
+        """Returns the handle of the history file, which is opened if necessary.
+
+        Args:
+            file_attr: The mode used for opening the file.
+
+        Returns:
+            The handle of the history file.
+
+        """
+        file = self.file
+        if file is None:
+            file = open(  # pylint: disable=consider-using-with
                 f"{self.result_dir}/history.txt", file_attr, encoding="utf-8"
-            ) as file:
-                file.write(f"{generate_output_str(self.db, self.precision)}\n")
-        fenics.MPI.barrier(fenics.MPI.comm_world)
+            )
+            self.file = file
+
+        return file
+
+    def close(self) -> None:
+        """Writes the buffered lines and closes the history file, if it is open."""
+        self._write_pending_lines()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def post_process(self) -> None:
+        """Closes the history file."""
+        if self.is_root:
+            self.close()
 
     def output_summary(self) -> None:
         """Save the summary in a file."""
-        if fenics.MPI.rank(fenics.MPI.comm_world) == 0:
-            with open(f"{self.result_dir}/history.txt", "a", encoding="utf-8") as file:
-                file.write(generate_summary_str(self.db, self.precision))
-        fenics.MPI.barrier(fenics.MPI.comm_world)
+        if self.is_root:
+            self._write_pending_lines()
+            self._open_file("a").write(generate_summary_str(self.db, self.precision))
+            self.close()
+        fenics.MPI.barrier(self.comm)
 
 
 class TempFileManager(IOManager):
@@ -325,12 +409,10 @@ class TempFileManager(IOManager):
                 self.config.getboolean("Mesh", "remesh")
                 and not self.config.getboolean("Debug", "remeshing")
                 and self.db.parameter_db.temp_dict
-                and fenics.MPI.rank(fenics.MPI.comm_world) == 0
+                and self.is_root
             ):
-                subprocess.run(  # nosec B603, B607
-                    ["rm", "-r", self.db.parameter_db.remesh_directory], check=True
-                )
-            fenics.MPI.barrier(fenics.MPI.comm_world)
+                shutil.rmtree(self.db.parameter_db.remesh_directory)
+            fenics.MPI.barrier(self.comm)
 
 
 class MeshManager(IOManager):
@@ -389,71 +471,153 @@ class XDMFFileManager(IOManager):
         self.save_state = self.config.getboolean("Output", "save_state")
         self.save_adjoint = self.config.getboolean("Output", "save_adjoint")
         self.save_gradient = self.config.getboolean("Output", "save_gradient")
+        self.has_output = self.save_state or self.save_adjoint or self.save_gradient
+        self.save_control = False
+        self.flush_every = self.config.getint("Output", "flush_every")
 
         self.is_initialized = False
 
-        self.state_xdmf_list: List[Union[str, List[str]]] = []
-        self.control_xdmf_list: List[Union[str, List[str]]] = []
-        self.adjoint_xdmf_list: List[Union[str, List[str]]] = []
-        self.gradient_xdmf_list: List[Union[str, List[str]]] = []
+        # the xdmf files are kept open between iterations, and they are closed
+        # every flush_every iterations and in the post-processing
+        self.xdmf_files: Dict[str, fenics.XDMFFile] = {}
+        # piecewise linear functions used for writing functions which cannot be
+        # written directly, e.g., from Real spaces
+        self.cg1_functions: Dict[str, fenics.Function] = {}
+
+        # the functions which are saved, together with the functions for their
+        # components (for mixed spaces), the paths to the xdmf files and the names
+        self.xdmf_outputs: List[
+            Tuple[
+                fenics.Function,
+                Optional[Tuple[fenics.FunctionAssigner, List[fenics.Function]]],
+                Union[str, List[str]],
+                Union[str, List[str]],
+            ]
+        ] = []
 
     def _initialize_states_xdmf(self) -> None:
         """Initializes the list of xdmf files for the state variables."""
         if self.save_state:
-            for i in range(self.db.parameter_db.state_dim):
-                self.state_xdmf_list.append(
-                    self._generate_xdmf_file_strings(
-                        self.db.function_db.state_spaces[i], f"state_{i:d}"
+            for i, state in enumerate(self.db.function_db.states):
+                space = self.db.function_db.state_spaces[i]
+                self.xdmf_outputs.append(
+                    (
+                        state,
+                        self._setup_sub_functions(space),
+                        self._generate_xdmf_file_strings(space, f"state_{i:d}"),
+                        self._generate_function_names(space, f"state_{i:d}"),
                     )
                 )
 
     def _initialize_controls_xdmf(self) -> None:
         """Initializes the list of xdmf files for the control variables."""
-        if self.save_state and self.db.parameter_db.problem_type in [
-            "control",
-            "topology",
-        ]:
-            for i in range(self.db.parameter_db.control_dim):
-                self.control_xdmf_list.append(
-                    self._generate_xdmf_file_strings(
-                        self.db.function_db.control_spaces[i], f"control_{i:d}"
+        if self.save_control:
+            for i, control in enumerate(self.db.function_db.controls):
+                self.xdmf_outputs.append(
+                    (
+                        control,
+                        None,
+                        self._generate_xdmf_file_strings(
+                            self.db.function_db.control_spaces[i], f"control_{i:d}"
+                        ),
+                        f"control_{i:d}",
                     )
                 )
 
     def _initialize_adjoints_xdmf(self) -> None:
         """Initialize the list of xdmf files for the adjoint variables."""
         if self.save_adjoint:
-            for i in range(self.db.parameter_db.state_dim):
-                self.adjoint_xdmf_list.append(
-                    self._generate_xdmf_file_strings(
-                        self.db.function_db.adjoint_spaces[i], f"adjoint_{i:d}"
+            for i, adjoint in enumerate(self.db.function_db.adjoints):
+                space = self.db.function_db.adjoint_spaces[i]
+                self.xdmf_outputs.append(
+                    (
+                        adjoint,
+                        self._setup_sub_functions(space),
+                        self._generate_xdmf_file_strings(space, f"adjoint_{i:d}"),
+                        self._generate_function_names(space, f"adjoint_{i:d}"),
                     )
                 )
 
     def _initialize_gradients_xdmf(self) -> None:
         """Initialize the list of xdmf files for the gradients."""
         if self.save_gradient:
-            for i in range(self.db.parameter_db.control_dim):
+            for i, gradient in enumerate(self.db.function_db.gradient):
                 if self.db.parameter_db.problem_type in ["control", "topology"]:
                     gradient_str = f"gradient_{i:d}"
                 else:
                     gradient_str = "shape_gradient"
-                self.gradient_xdmf_list.append(
-                    self._generate_xdmf_file_strings(
-                        self.db.function_db.control_spaces[i], gradient_str
+                self.xdmf_outputs.append(
+                    (
+                        gradient,
+                        None,
+                        self._generate_xdmf_file_strings(
+                            self.db.function_db.control_spaces[i], gradient_str
+                        ),
+                        f"gradient_{i:d}",
                     )
                 )
 
     def _initialize_xdmf_lists(self) -> None:
         """Initializes the lists of xdmf files."""
         if not self.is_initialized:
+            # the problem type is only fixed once the optimization has started
+            self.save_control = self.save_state and (
+                self.db.parameter_db.problem_type in ["control", "topology"]
+            )
+
             self._initialize_states_xdmf()
             self._initialize_controls_xdmf()
             self._initialize_adjoints_xdmf()
             self._initialize_gradients_xdmf()
 
+            # the functions are labeled once, as their names do not change
+            for function, sub_functions, _, function_name in self.xdmf_outputs:
+                if sub_functions is not None:
+                    for sub_function, sub_name in zip(sub_functions[1], function_name):
+                        sub_function.rename(sub_name, sub_name)
+                else:
+                    function.rename(cast(str, function_name), cast(str, function_name))
+
             self.is_initialized = True
 
+    @staticmethod
+    def _is_mixed(space: fenics.FunctionSpace) -> bool:
+        """Checks, whether a function space is a mixed space.
+
+        Args:
+            space: The FEM function space.
+
+        Returns:
+            ``True`` if the space is mixed, ``False`` otherwise.
+
+        """
+        return bool(
+            space.num_sub_spaces() > 0 and space.ufl_element().family() == "Mixed"
+        )
+
+    def _setup_sub_functions(
+        self, space: fenics.FunctionSpace
+    ) -> Optional[Tuple[fenics.FunctionAssigner, List[fenics.Function]]]:
+        """Sets up the functions used for saving the components of mixed functions.
+
+        The components are assigned to these functions for every output, so that
+        the collapsed sub spaces do not have to be created again in each iteration.
+
+        Args:
+            space: The FEM function space where the function is taken from.
+
+        Returns:
+            A tuple consisting of the assigner and the functions on the (collapsed)
+            sub spaces, or ``None`` if the space is not mixed.
+
+        """
+        if not self._is_mixed(space):
+            return None
+
+        sub_spaces = [space.sub(j).collapse() for j in range(space.num_sub_spaces())]
+        sub_functions = [fenics.Function(sub_space) for sub_space in sub_spaces]
+        return fenics.FunctionAssigner(sub_spaces, space), sub_functions
+
     def _generate_xdmf_file_strings(
         self, space: fenics.FunctionSpace, name: str
     ) -> Union[str, List[str]]:
@@ -467,7 +631,7 @@ class XDMFFileManager(IOManager):
             A string containing the path to the xdmf files for visualization.
 
         """
-        if space.num_sub_spaces() > 0 and space.ufl_element().family() == "Mixed":
+        if self._is_mixed(space):
             lst = []
             for j in range(space.num_sub_spaces()):
                 lst.append(f"{self.result_dir}/checkpoints/{name}_{j:d}.xdmf")
@@ -476,88 +640,45 @@ class XDMFFileManager(IOManager):
             file = f"{self.result_dir}/checkpoints/{name}.xdmf"
             return file
 
-    def _save_states(self, iteration: int) -> None:
-        """Saves the state variables to xdmf files.
+    def _generate_function_names(
+        self, space: fenics.FunctionSpace, name: str
+    ) -> Union[str, List[str]]:
+        """Generates the names of the functions in the xdmf files.
 
         Args:
-            iteration: The current iteration count.
-
-        """
-        if self.save_state:
-            for i in range(self.db.parameter_db.state_dim):
-                if isinstance(self.state_xdmf_list[i], list):
-                    for j in range(len(self.state_xdmf_list[i])):
-                        self._write_xdmf_step(
-                            self.state_xdmf_list[i][j],
-                            self.db.function_db.states[i].sub(j, True),
-                            f"state_{i}_sub_{j}",
-                            iteration,
-                        )
-                else:
-                    self._write_xdmf_step(
-                        cast(str, self.state_xdmf_list[i]),
-                        self.db.function_db.states[i],
-                        f"state_{i}",
-                        iteration,
-                    )
-
-    def _save_controls(self, iteration: int) -> None:
-        """Saves the control variables to xdmf.
+            space: The FEM function space where the function is taken from.
+            name: The name of the function.
 
-        Args:
-            iteration: The current iteration count.
+        Returns:
+            The name of the function, or a list of names of its components if the
+            space is mixed.
 
         """
-        if self.save_state and self.db.parameter_db.problem_type in [
-            "control",
-            "topology",
-        ]:
-            for i in range(len(self.db.function_db.controls)):
-                self._write_xdmf_step(
-                    cast(str, self.control_xdmf_list[i]),
-                    self.db.function_db.controls[i],
-                    f"control_{i}",
-                    iteration,
-                )
+        if self._is_mixed(space):
+            return [f"{name}_sub_{j:d}" for j in range(space.num_sub_spaces())]
+        else:
+            return name
 
-    def _save_adjoints(self, iteration: int) -> None:
-        """Saves the adjoint variables to xdmf files.
+    def _save_functions(self, iteration: int) -> None:
+        """Saves all functions to their xdmf files.
 
         Args:
             iteration: The current iteration count.
 
         """
-        if self.save_adjoint:
-            for i in range(self.db.parameter_db.state_dim):
-                if isinstance(self.adjoint_xdmf_list[i], list):
-                    for j in range(len(self.adjoint_xdmf_list[i])):
-                        self._write_xdmf_step(
-                            self.adjoint_xdmf_list[i][j],
-                            self.db.function_db.adjoints[i].sub(j, True),
-                            f"adjoint_{i}_sub_{j}",
-                            iteration,
-                        )
-                else:
+        for function, sub_functions, filename, function_name in self.xdmf_outputs:
+            if sub_functions is not None:
+                assigner, functions = sub_functions
+                assigner.assign(functions, function)
+                for j, sub_function in enumerate(functions):
                     self._write_xdmf_step(
-                        cast(str, self.adjoint_xdmf_list[i]),
-                        self.db.function_db.adjoints[i],
-                        f"adjoint_{i}",
-                        iteration,
+                        filename[j], sub_function, function_name[j], iteration
                     )
-
-    def _save_gradients(self, iteration: int) -> None:
-        """Saves the gradients to xdmf files.
-
-        Args:
-            iteration: The current iteration count.
-
-        """
-        if self.save_gradient:
-            for i in range(self.db.parameter_db.control_dim):
+            else:
                 self._write_xdmf_step(
-                    cast(str, self.gradient_xdmf_list[i]),
-                    self.db.function_db.gradient[i],
-                    f"gradient_{i}",
+                    cast(str, filename),
+                    function,
+                    cast(str, function_name),
                     iteration,
                 )
 
@@ -582,43 +703,100 @@ class XDMFFileManager(IOManager):
         else:
             append = True
 
-        mesh = function.function_space().mesh()
-        comm = mesh.mpi_comm()
+        comm = function.function_space().mesh().mpi_comm()
 
         if function.function_space().ufl_element().family() in [
             "Real",
             "NodalEnrichedElement",
         ]:
+            function = self._interpolate_to_cg1(filename, function, function_name)
+
+        file = self._get_xdmf_file(filename, comm)
+        file.write_checkpoint(
+            function,
+            function_name,
+            iteration,
+            fenics.XDMFFile.Encoding.HDF5,
+            append,
+        )
+        fenics.MPI.barrier(comm)
+
+    def _interpolate_to_cg1(
+        self, filename: str, function: fenics.Function, function_name: str
+    ) -> fenics.Function:
+        """Interpolates a function to a piecewise linear function for the output.
+
+        The piecewise linear function is created once for each xdmf file and is
+        reused in the subsequent iterations.
+
+        Args:
+            filename: The path to the xdmf file.
+            function: The function which is to be interpolated.
+            function_name: The label of the function in the xdmf file.
+
+        Returns:
+            The piecewise linear interpolant of the function.
+
+        """
+        if filename not in self.cg1_functions:
+            mesh = function.function_space().mesh()
             if len(function.ufl_shape) > 0:
                 space = fenics.VectorFunctionSpace(
                     mesh, "CG", 1, dim=function.ufl_shape[0]
                 )
             else:
                 space = fenics.FunctionSpace(mesh, "CG", 1)
-            function = fenics.interpolate(function, space)
+            cg1_function = fenics.Function(space)
+            cg1_function.rename(function_name, function_name)
+            self.cg1_functions[filename] = cg1_function
+
+        cg1_function = self.cg1_functions[filename]
+        cg1_function.interpolate(function)
+        return cg1_function
 
-        function.rename(function_name, function_name)
+    def _get_xdmf_file(self, filename: str, comm: MPI.Comm) -> fenics.XDMFFile:
+        """Returns the handle of an xdmf file, which is opened if necessary.
 
-        with fenics.XDMFFile(comm, filename) as file:
-            file.parameters["flush_output"] = True
+        Args:
+            filename: The path to the xdmf file.
+            comm: The MPI communicator used for opening the file.
+
+        Returns:
+            The handle of the xdmf file.
+
+        """
+        if filename not in self.xdmf_files:
+            file = fenics.XDMFFile(comm, filename)
+            # the files are closed periodically, which flushes the output, so it is
+            # not flushed after every write
+            file.parameters["flush_output"] = False
             file.parameters["functions_share_mesh"] = False
-            file.write_checkpoint(
-                function,
-                function_name,
-                iteration,
-                fenics.XDMFFile.Encoding.HDF5,
-                append,
-            )
-        fenics.MPI.barrier(comm)
+            self.xdmf_files[filename] = file
+
+        return self.xdmf_files[filename]
+
+    def close(self) -> None:
+        """Closes all xdmf files, which are currently open."""
+        for file in self.xdmf_files.values():
+            file.close()
+        self.xdmf_files.clear()
+
+    def post_process(self) -> None:
+        """Closes the xdmf files."""
+        self.close()
 
     def output(self) -> None:
         """Saves the variables to xdmf files."""
+        if not self.has_output:
+            return
+
         self._initialize_xdmf_lists()
 
         iteration = int(self.db.parameter_db.optimization_state["iteration"])
 
         if iteration == 0:
-            if fenics.MPI.rank(fenics.MPI.comm_world) == 0:
+            self.close()
+            if self.is_root:
                 directory = f"{self.result_dir}/checkpoints/"
                 for files in os.listdir(directory):
                     path = os.path.join(directory, files)
@@ -627,9 +805,11 @@ class XDMFFileManager(IOManager):
                     except OSError:
                         os.remove(path)
 
-            fenics.MPI.barrier(fenics.MPI.comm_world)
+            fenics.MPI.barrier(self.comm)
+
+        self._save_functions(iteration)
 
-        self._save_states(iteration)
-        self._save_controls(iteration)
-        self._save_adjoints(iteration)
-        self._save_gradients(iteration)
+        # closing the files writes the data to disk, they are reopened for the next
+        # output
+        if iteration % self.flush_every == 0:
+            self.close()
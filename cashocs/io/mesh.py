@@ -22,13 +22,14 @@ from __future__ import annotations
 import configparser
 import json
 import pathlib
-import subprocess  # nosec B404
+import shutil
 import tempfile
 import time
 from typing import Dict, Optional, TYPE_CHECKING
 
 import fenics
 import h5py
+import meshio
 import numpy as np
 
 from cashocs import _exceptions
@@ -208,33 +209,17 @@ def _import_xdmf_mesh(
     xdmf_file.read(mesh)
     xdmf_file.close()
 
-    subdomains_mvc = fenics.MeshValueCollection(
-        "size_t", mesh, mesh.geometric_dimension()
-    )
-    boundaries_mvc = fenics.MeshValueCollection(
-        "size_t", mesh, mesh.geometric_dimension() - 1
-    )
-
     subdomains_path = pathlib.Path(f"{file_string}_subdomains.xdmf")
-    if subdomains_path.is_file():
-        xdmf_subdomains = fenics.XDMFFile(mesh.mpi_comm(), str(subdomains_path))
-        xdmf_subdomains.read(subdomains_mvc, "subdomains")
-        xdmf_subdomains.close()
-
     boundaries_path = pathlib.Path(f"{file_string}_boundaries.xdmf")
-    if boundaries_path.is_file():
-        xdmf_boundaries = fenics.XDMFFile(mesh.mpi_comm(), str(boundaries_path))
-        xdmf_boundaries.read(boundaries_mvc, "boundaries")
-        xdmf_boundaries.close()
-
-    physical_groups: Optional[Dict[str, Dict[str, int]]] = None
     physical_groups_path = pathlib.Path(f"{file_string}_physical_groups.json")
-    if physical_groups_path.is_file():
-        with physical_groups_path.open("r", encoding="utf-8") as file:
-            physical_groups = json.load(file)
 
-    subdomains = fenics.MeshFunction("size_t", mesh, subdomains_mvc)
-    boundaries = fenics.MeshFunction("size_t", mesh, boundaries_mvc)
+    subdomains = _read_mesh_function(
+        mesh, subdomains_path, "subdomains", mesh.geometric_dimension()
+    )
+    boundaries = _read_mesh_function(
+        mesh, boundaries_path, "boundaries", mesh.geometric_dimension() - 1
+    )
+    physical_groups = _read_physical_groups(physical_groups_path)
 
     dx = measure_module.NamedMeasure(
         "dx", domain=mesh, subdomain_data=subdomains, physical_groups=physical_groups
@@ -253,6 +238,54 @@ def _import_xdmf_mesh(
     return mesh, subdomains, boundaries, dx, ds, d_interior_facet
 
 
+def _read_mesh_function(
+    mesh: fenics.Mesh, path: pathlib.Path, name: str, dim: int
+) -> fenics.MeshFunction:
+    """Reads a mesh function from an XDMF file, if it exists.
+
+    Args:
+        mesh: The corresponding mesh.
+        path: The path to the XDMF file.
+        name: The name of the data in the XDMF file.
+        dim: The topological dimension of the mesh entities.
+
+    Returns:
+        The mesh function. If the file does not exist, all entries are unmarked,
+        i.e., they have the maximum value of size_t as for an empty mesh value
+        collection.
+
+    """
+    if not path.is_file():
+        return fenics.MeshFunction("size_t", mesh, dim, int(np.iinfo(np.uintp).max))
+
+    mvc = fenics.MeshValueCollection("size_t", mesh, dim)
+    xdmf_file = fenics.XDMFFile(mesh.mpi_comm(), str(path))
+    xdmf_file.read(mvc, name)
+    xdmf_file.close()
+
+    return fenics.MeshFunction("size_t", mesh, mvc)
+
+
+def _read_physical_groups(
+    path: pathlib.Path,
+) -> Optional[Dict[str, Dict[str, int]]]:
+    """Reads the physical groups of a mesh from a json file, if it exists.
+
+    Args:
+        path: The path to the json file.
+
+    Returns:
+        The physical groups or ``None`` if the file does not exist.
+
+    """
+    physical_groups: Optional[Dict[str, Dict[str, int]]] = None
+    if path.is_file():
+        with path.open("r", encoding="utf-8") as file:
+            physical_groups = json.load(file)
+
+    return physical_groups
+
+
 def export_mesh(
     mesh: fenics.Mesh,
     mesh_file: str,
@@ -638,23 +671,17 @@ def extract_mesh_from_xdmf(
 
             fenics.MPI.barrier(fenics.MPI.comm_world)
             if fenics.MPI.rank(fenics.MPI.comm_world) == 0:
-                subprocess.run(  # nosec B603, B607
-                    [
-                        "meshio",
-                        "convert",
-                        "--output-format",
-                        "gmsh",
-                        "--ascii",
-                        mesh_location_xdmf,
-                        outputfile,
-                    ],
-                    check=True,
+                meshio.write(
+                    outputfile,
+                    meshio.read(mesh_location_xdmf),
+                    file_format="gmsh",
+                    binary=False,
                 )
             fenics.MPI.barrier(fenics.MPI.comm_world)
         finally:
             fenics.MPI.barrier(fenics.MPI.comm_world)
             if fenics.MPI.rank(fenics.MPI.comm_world) == 0:
-                subprocess.run(["rm", "-r", tempdir], check=True)  # nosec B603, B607
+                shutil.rmtree(tempdir)
             fenics.MPI.barrier(fenics.MPI.comm_world)
 
     else:
@@ -21,7 +21,9 @@ from __future__ import annotations
 
 from datetime import datetime as dt
 import pathlib
-from typing import List, TYPE_CHECKING
+from typing import List, TYPE_CHECKING, Union
+
+import fenics
 
 from cashocs.io import managers
 
@@ -75,10 +77,15 @@ class OutputManager:
             checkpoints_path.mkdir(parents=True, exist_ok=True)
 
         self.managers: List[managers.IOManager] = []
+        # the managers which share the output string of each iteration
+        self.str_managers: List[
+            Union[managers.ConsoleManager, managers.FileManager]
+        ] = []
         if verbose:
-            self.managers.append(managers.ConsoleManager(self.db, self.result_dir))
+            self.str_managers.append(managers.ConsoleManager(self.db, self.result_dir))
         if save_txt:
-            self.managers.append(managers.FileManager(self.db, self.result_dir))
+            self.str_managers.append(managers.FileManager(self.db, self.result_dir))
+        self.managers.extend(self.str_managers)
         if save_state or save_adjoint or save_gradient:
             self.managers.append(managers.XDMFFileManager(self.db, self.result_dir))
 
@@ -86,12 +93,31 @@ class OutputManager:
         self.output_dict = result_manager.output_dict
         self.managers.append(result_manager)
 
-        self.managers.append(managers.MeshManager(self.db, self.result_dir))
+        if save_mesh:
+            self.managers.append(managers.MeshManager(self.db, self.result_dir))
         self.managers.append(managers.TempFileManager(self.db, self.result_dir))
 
+        # only the managers which actually write something in each iteration are
+        # called by output
+        self.iteration_managers = [
+            manager
+            for manager in self.managers
+            if type(manager).output is not managers.IOManager.output
+            and manager not in self.str_managers
+        ]
+
+        self.precision = self.config.getint("Output", "precision")
+        self.is_root = fenics.MPI.rank(fenics.MPI.comm_world) == 0
+
     def output(self) -> None:
         """Writes the desired output to files and console."""
-        for manager in self.managers:
+        if self.str_managers and self.is_root:
+            # the output string is generated once and shared by console and file
+            output_str = managers.generate_output_str(self.db, self.precision)
+            for str_manager in self.str_managers:
+                str_manager.output(output_str)
+
+        for manager in self.iteration_managers:
             manager.output()
 
     def output_summary(self) -> None:
@@ -103,3 +129,8 @@ class OutputManager:
         """Performs a postprocessing of the output."""
         for manager in self.managers:
             manager.post_process()
+
+    def close(self) -> None:
+        """Closes all files which are kept open by the managers."""
+        for manager in self.managers:
+            manager.close()
@@ -146,59 +146,80 @@ def picard_iteration(
     prefix = "Picard iteration:  "
 
     res_tensor = [fenics.PETScVector(comm) for _ in u_list]
-    eta_max = 0.9
-    gamma = 0.9
+
+    # the solvers are only set up if the first residual is not already small enough
+    snes_solvers: List[snes.SNESSolver] = []
+
     res_0 = 1.0
     tol = 1.0
 
-    for i in range(max_iter + 1):
-        res = _compute_residual(form_list, res_tensor, bcs_list_hom)
-        if i == 0:
-            res_0 = res
-            tol = atol + rtol * res_0
-        if is_printing:
-            if i % 10 == 0:
-                info_str = f"\n{prefix}iter,  abs. residual,  rel. residual\n\n"
-            else:
-                info_str = ""
-            val_str = f"{prefix}{i:4d},  {res:>13.3e},  {res/res_0:>13.3e}"
-
-            print(info_str + val_str, flush=True)
-        if res <= tol:
-            break
-
-        if i == max_iter:
-            raise _exceptions.NotConvergedError("Picard iteration")
-
-        for j in range(len(u_list)):
-            eta = np.minimum(gamma * res, eta_max)
-            eta = np.minimum(
-                eta_max,
-                np.maximum(eta, 0.5 * tol / res),
-            )
-
-            ksp_option, A_tensor, b_tensor = _get_linear_solver_options(
-                j, ksp_options, A_tensors, b_tensors
-            )
-
-            snes.snes_solve(
-                form_list[j],
-                u_list[j],
-                bcs_list[j],
-                derivative=newton_linearization_list[j],
-                petsc_options=ksp_option,
-                rtol=eta,
-                atol=atol * 1e-1,
-                max_iter=inner_max_iter,
-                A_tensor=A_tensor,
-                b_tensor=b_tensor,
-                preconditioner_form=preconditioner_form_list[j],
-            )
+    try:
+        for i in range(max_iter + 1):
+            res = _compute_residual(form_list, res_tensor, bcs_list_hom)
+            if i == 0:
+                res_0 = res
+                tol = atol + rtol * res_0
+            if is_printing:
+                if i % 10 == 0:
+                    info_str = f"\n{prefix}iter,  abs. residual,  rel. residual\n\n"
+                else:
+                    info_str = ""
+                val_str = f"{prefix}{i:4d},  {res:>13.3e},  {res/res_0:>13.3e}"
+
+                print(info_str + val_str, flush=True)
+            if res <= tol:
+                break
+
+            if i == max_iter:
+                raise _exceptions.NotConvergedError("Picard iteration")
+
+            if not snes_solvers:
+                snes_solvers = _setup_snes_solvers(
+                    form_list,
+                    u_list,
+                    bcs_list,
+                    atol,
+                    inner_max_iter,
+                    ksp_options,
+                    A_tensors,
+                    b_tensors,
+                    preconditioner_form_list,
+                    newton_linearization_list,
+                )
+            _solve_components(snes_solvers, res, tol)
+    finally:
+        for snes_solver in snes_solvers:
+            snes_solver.destroy()
 
     if is_printing:
         print("", flush=True)
 
 
+def _solve_components(
+    snes_solvers: List[snes.SNESSolver], res: float, tol: float
+) -> None:
+    """Solves the equations of the system one after another.
+
+    Args:
+        snes_solvers: The SNES solvers for the components of the system.
+        res: The current residual of the system.
+        tol: The tolerance of the Picard iteration.
+
+    """
+    eta_max = 0.9
+    gamma = 0.9
+
+    eta = np.minimum(gamma * res, eta_max)
+    eta = np.minimum(
+        eta_max,
+        np.maximum(eta, 0.5 * tol / res),
+    )
+
+    for snes_solver in snes_solvers:
+        snes_solver.rtol = eta
+        snes_solver.solve()
+
+
 def _compute_residual(
     form_list: List[ufl.Form],
     res_tensor: List[fenics.PETScVector],
@@ -247,3 +268,46 @@ def _get_linear_solver_options(
     b_tensor = b_tensors[j] if b_tensors is not None else None
 
     return ksp_option, A_tensor, b_tensor
+
+
+def _setup_snes_solvers(
+    form_list: List[ufl.Form],
+    u_list: List[fenics.Function],
+    bcs_list: List[List[fenics.DirichletBC]],
+    atol: float,
+    inner_max_iter: int,
+    ksp_options: Optional[List[_typing.KspOption]],
+    # pylint: disable=invalid-name
+    A_tensors: Optional[List[fenics.PETScMatrix]],
+    b_tensors: Optional[List[fenics.PETScVector]],
+    preconditioner_form_list: List[Optional[ufl.Form]],
+    newton_linearization_list: List[Optional[ufl.Form]],
+) -> List[snes.SNESSolver]:
+    """Sets up the SNES solvers for the components, which are reused in all iterations.
+
+    Returns:
+        The list of SNES solvers, one for each component.
+
+    """
+    snes_solvers = []
+    for j in range(len(u_list)):
+        # pylint: disable=invalid-name
+        ksp_option, A_tensor, b_tensor = _get_linear_solver_options(
+            j, ksp_options, A_tensors, b_tensors
+        )
+        snes_solvers.append(
+            snes.SNESSolver(
+                form_list[j],
+                u_list[j],
+                bcs_list[j],
+                derivative=newton_linearization_list[j],
+                petsc_options=ksp_option,
+                atol=atol * 1e-1,
+                max_iter=inner_max_iter,
+                A_tensor=A_tensor,
+                b_tensor=b_tensor,
+                preconditioner_form=preconditioner_form_list[j],
+            )
+        )
+
+    return snes_solvers
@@ -19,8 +19,7 @@
 
 from __future__ import annotations
 
-import copy
-from typing import List, Optional, TYPE_CHECKING, Union
+from typing import Dict, List, Optional, TYPE_CHECKING, Union
 
 import fenics
 from petsc4py import PETSc
@@ -45,6 +44,25 @@ default_snes_options: _typing.KspOption = {
 }
 
 
+def _ident_zeros(matrix: fenics.PETScMatrix, diagonal: PETSc.Vec) -> None:
+    """Sets the diagonal entries of zero rows of a matrix to one.
+
+    As a zero row also has a zero diagonal entry, the (costly) search for zero rows
+    is only carried out if the diagonal of the matrix contains a zero, using the
+    same tolerance as :py:meth:`fenics.PETScMatrix.ident_zeros`.
+
+    Args:
+        matrix: The matrix, whose zero rows are modified.
+        diagonal: A work vector for the diagonal of the matrix.
+
+    """
+    matrix.mat().getDiagonal(result=diagonal)
+    diagonal.abs()
+    _, min_diagonal = diagonal.min()
+    if min_diagonal < fenics.DOLFIN_EPS:
+        matrix.ident_zeros()
+
+
 class SNESSolver:
     """Interface for using PETSc's SNES solver."""
 
@@ -104,11 +122,22 @@ class SNESSolver:
         self.is_preassembled = False
 
         if petsc_options is None:
-            self.petsc_options: _typing.KspOption = copy.deepcopy(default_snes_options)
-            self.petsc_options.update(_utils.linalg.direct_ksp_options)
+            # the options only contain immutable values, so no deep copy is needed
+            self.petsc_options: _typing.KspOption = {
+                **default_snes_options,
+                **_utils.linalg.direct_ksp_options,
+            }
         else:
             self.petsc_options = petsc_options
 
+        # for a matrix-free Jacobian, SNES does not use the assembled matrices
+        self.is_matrix_free = self.petsc_options.get("snes_mf", False) is not False
+        # with a matrix-free operator, the assembled Jacobian is only used for the
+        # preconditioner
+        self.is_mf_operator = (
+            self.petsc_options.get("snes_mf_operator", False) is not False
+        )
+
         if preconditioner_form is not None:
             if len(preconditioner_form.arguments()) == 1:
                 self.preconditioner_form = fenics.derivative(
@@ -129,25 +158,29 @@ class SNESSolver:
         )
         self.assembler.keep_diagonal = True
 
+        # the fenics wrappers are kept, so that they can be used in the callbacks
+        # pylint: disable=invalid-name
         if A_tensor is not None:
-            self.A_petsc = A_tensor.mat()  # pylint: disable=invalid-name
+            self.A_fenics = A_tensor
         else:
-            self.A_petsc = fenics.PETScMatrix(self.comm).mat()
+            self.A_fenics = fenics.PETScMatrix(self.comm)
+        self.A_petsc = self.A_fenics.mat()
 
         if b_tensor is not None:
-            self.residual_petsc = b_tensor.vec()
+            self.residual_fenics = b_tensor
         else:
-            self.residual_petsc = fenics.PETScVector(self.comm).vec()
+            self.residual_fenics = fenics.PETScVector(self.comm)
+        self.residual_petsc = self.residual_fenics.vec()
 
         if self.preconditioner_form is not None:
             self.assembler_pc = fenics.SystemAssembler(
                 self.preconditioner_form, self.nonlinear_form, self.bcs
             )
             self.assembler_pc.keep_diagonal = True
-            self.P_petsc = fenics.PETScMatrix(  # pylint: disable=invalid-name
-                self.comm
-            ).mat()
+            self.P_fenics: Optional[fenics.PETScMatrix] = fenics.PETScMatrix(self.comm)
+            self.P_petsc = self.P_fenics.mat()
         else:
+            self.P_fenics = None
             self.P_petsc = None
 
         self.assembler_shift: Optional[fenics.SystemAssembler] = None
@@ -158,6 +191,42 @@ class SNESSolver:
             )
             self.residual_shift = fenics.PETScVector(self.comm)
 
+        # the SNES object is created in the first solve and reused afterwards
+        self.snes: Optional[PETSc.SNES] = None
+        # work vectors for the diagonals of the matrices, keyed by their handles
+        self.diagonals: Dict[int, PETSc.Vec] = {}
+
+    def _get_diagonal(self, matrix: fenics.PETScMatrix) -> PETSc.Vec:
+        """Returns the work vector for the diagonal of a matrix.
+
+        Args:
+            matrix: The (assembled) matrix.
+
+        Returns:
+            The work vector, which is created in the first call for the matrix.
+
+        """
+        mat = matrix.mat()
+        if mat.handle not in self.diagonals:
+            self.diagonals[mat.handle] = mat.createVecs("left")
+
+        return self.diagonals[mat.handle]
+
+    def _update_solution(self, x: PETSc.Vec) -> None:
+        """Updates the solution function with the current iterate of SNES.
+
+        The values are only copied if SNES does not evaluate at the solution vector
+        itself, e.g., during the line search.
+
+        Args:
+            x: The current iterate.
+
+        """
+        u_vec = self.u.vector().vec()
+        if x.handle != u_vec.handle:
+            x.copy(u_vec)
+        self.u.vector().apply("")
+
     def assemble_function(
         self,
         snes: PETSc.SNES,  # pylint: disable=unused-argument
@@ -172,9 +241,11 @@ class SNESSolver:
             f: The vector in which the function evaluation is stored.
 
         """
-        self.u.vector().vec().setArray(x)
-        self.u.vector().apply("")
-        f = fenics.PETScVector(f)
+        self._update_solution(x)
+        if f.handle == self.residual_petsc.handle:
+            f = self.residual_fenics
+        else:
+            f = fenics.PETScVector(f)
 
         self.assembler.assemble(f, self.u.vector())
         if (
@@ -201,52 +272,126 @@ class SNESSolver:
             P: The matrix storing the preconditioner for the Jacobian.
 
         """
+        if self.is_mf_operator:
+            # this updates the base point of the matrix-free operator of SNES
+            J.assemble()
+
         if not self.is_preassembled:
-            self.u.vector().vec().setArray(x)
-            self.u.vector().apply("")
+            self._update_solution(x)
+            self._assemble_matrices(J, P)
+        else:
+            self.is_preassembled = False
+
+    def _assemble_matrices(
+        self,
+        J: Optional[PETSc.Mat],  # pylint: disable=invalid-name
+        P: Optional[PETSc.Mat],  # pylint: disable=invalid-name
+    ) -> None:
+        """Assembles the Jacobian and the preconditioner matrix.
+
+        With ``snes_mf_operator``, the Jacobian is applied matrix-free by SNES and the
+        Jacobian form is assembled into the preconditioner matrix instead, unless a
+        preconditioner form is given.
 
-            J = fenics.PETScMatrix(J)  # pylint: disable=invalid-name
-            self.assembler.assemble(J)
-            J.ident_zeros()
+        Args:
+            J: The matrix storing the Jacobian. This is not used with
+                ``snes_mf_operator``, where it may be ``None``.
+            P: The matrix storing the preconditioner for the Jacobian.
 
-            if self.preconditioner_form is not None:
-                P = fenics.PETScMatrix(P)  # pylint: disable=invalid-name
-                self.assembler_pc.assemble(P)
-                P.ident_zeros()
+        """
+        if self.is_mf_operator:
+            if self.preconditioner_form is None:
+                self._assemble_matrix(self.assembler, P, self.A_fenics)
         else:
-            self.is_preassembled = False
+            self._assemble_matrix(self.assembler, J, self.A_fenics)
 
-    def solve(self) -> fenics.Function:
-        """Solves the nonlinear problem with PETSc's SNES."""
+        if self.preconditioner_form is not None:
+            self._assemble_matrix(self.assembler_pc, P, self.P_fenics)
+
+    def _assemble_matrix(
+        self,
+        assembler: fenics.SystemAssembler,
+        mat: PETSc.Mat,
+        matrix_fenics: Optional[fenics.PETScMatrix],
+    ) -> None:
+        """Assembles a matrix and sets the diagonal entries of its zero rows to one.
+
+        Args:
+            assembler: The assembler for the matrix.
+            mat: The PETSc matrix, into which the form is assembled.
+            matrix_fenics: The fenics wrapper of the matrix, which is reused if it
+                wraps ``mat``.
+
+        """
+        if matrix_fenics is not None and mat.handle == matrix_fenics.mat().handle:
+            matrix = matrix_fenics
+        else:
+            matrix = fenics.PETScMatrix(mat)
+        assembler.assemble(matrix)
+        _ident_zeros(matrix, self._get_diagonal(matrix))
+
+    def _setup_snes(self) -> PETSc.SNES:
+        """Creates and sets up the SNES object.
+
+        Returns:
+            The SNES object used for solving the nonlinear problem.
+
+        """
         snes = PETSc.SNES().create()
 
         snes.setFunction(self.assemble_function, self.residual_petsc)
-        snes.setJacobian(self.assemble_jacobian, self.A_petsc, self.P_petsc)
+        if self.is_mf_operator:
+            # SNES creates the matrix-free operator, so that the assembled matrix is
+            # only used for the preconditioner
+            # pylint: disable=invalid-name
+            P_petsc = self.P_petsc if self.P_petsc is not None else self.A_petsc
+            snes.setJacobian(self.assemble_jacobian, None, P_petsc)
+        else:
+            P_petsc = self.P_petsc
+            snes.setJacobian(self.assemble_jacobian, self.A_petsc, P_petsc)
 
         ksp = snes.getKSP()
         _utils.linalg.setup_fieldsplit_preconditioner(self.u, ksp, self.petsc_options)
 
-        if fenics.PETScMatrix(self.A_petsc).empty():
-            self.assemble_jacobian(
-                snes, self.u.vector().vec(), self.A_petsc, self.P_petsc
+        if not self.is_matrix_free and self.A_fenics.empty():
+            self._update_solution(self.u.vector().vec())
+            self._assemble_matrices(
+                None if self.is_mf_operator else self.A_petsc, P_petsc
             )
             self.is_preassembled = True
 
         _utils.setup_petsc_options([snes], [self.petsc_options])
-        snes.setTolerances(rtol=self.rtol, atol=self.atol, max_it=self.max_iter)
-        snes.solve(None, self.u.vector().vec())
 
-        converged_reason = snes.getConvergedReason()
+        return snes
+
+    def solve(self) -> fenics.Function:
+        """Solves the nonlinear problem with PETSc's SNES."""
+        if self.snes is None:
+            self.snes = self._setup_snes()
+
+        self.snes.setTolerances(rtol=self.rtol, atol=self.atol, max_it=self.max_iter)
+        self.snes.solve(None, self.u.vector().vec())
+
+        converged_reason = self.snes.getConvergedReason()
         if converged_reason < 0:
             raise _exceptions.PETScSNESError(converged_reason)
 
-        if hasattr(PETSc, "garbage_cleanup"):
-            snes.destroy()
-            PETSc.garbage_cleanup(comm=self.comm)
-            PETSc.garbage_cleanup()
-
         return self.u
 
+    def destroy(self) -> None:
+        """Destroys the SNES object, so that it is created again for the next solve."""
+        for diagonal in self.diagonals.values():
+            diagonal.destroy()
+        self.diagonals.clear()
+
+        if self.snes is not None:
+            self.snes.destroy()
+            self.snes = None
+
+            if hasattr(PETSc, "garbage_cleanup"):
+                PETSc.garbage_cleanup(comm=self.comm)
+                PETSc.garbage_cleanup()
+
 
 def snes_solve(
     nonlinear_form: ufl.Form,
@@ -265,7 +410,10 @@ def snes_solve(
     """Solve a nonlinear PDE problem with PETSc SNES.
 
     An overview over possible PETSc command line options for the SNES can be found
-    at `<https://petsc.org/release/manualpages/SNES/>`_.
+    at `<https://petsc.org/release/manualpages/SNES/>`_. In particular, a
+    matrix-free Newton-Krylov method can be used with the option ``snes_mf``, and
+    the option ``snes_mf_operator`` uses the assembled Jacobian only for the
+    preconditioner.
 
     Args:
         nonlinear_form: The variational form of the nonlinear problem to be solved
@@ -310,4 +458,6 @@ def snes_solve(
     )
 
     solution = solver.solve()
+    solver.destroy()
+
     return solution
@@ -140,6 +140,39 @@ def test_regular_mesh(rng, unit_square_mesh, regular_mesh):
     fenics.MPI.barrier(fenics.MPI.comm_world)
 
 
+def test_regular_mesh_scaled():
+    lens = np.array([0.5, 1.5, 2.0])
+    offset = np.array([-0.25, 0.5, 0.75])
+
+    for dim in [2, 3]:
+        mesh, _, boundaries, _, ds, _ = cashocs.regular_mesh_scaled(
+            3, lens[:dim], offset[:dim]
+        )
+        s_mesh, _, s_boundaries, _, _, _ = cashocs.regular_box_mesh(
+            3,
+            *offset[:2],
+            offset[2] if dim == 3 else None,
+            *(offset[:2] + lens[:2]),
+            offset[2] + lens[2] if dim == 3 else None,
+        )
+
+        coords = gather_coordinates(mesh)
+        s_coords = gather_coordinates(s_mesh)
+        if fenics.MPI.rank(fenics.MPI.comm_world) == 0:
+            assert np.allclose(coords, s_coords)
+        fenics.MPI.barrier(fenics.MPI.comm_world)
+
+        assert np.all(boundaries.array() == s_boundaries.array())
+        for i in range(dim):
+            area = np.prod(np.delete(lens[:dim], i))
+            assert abs(fenics.assemble(1 * ds(2 * i + 1)) - area) < 1e-12
+            assert abs(fenics.assemble(1 * ds(2 * i + 2)) - area) < 1e-12
+
+    with pytest.raises(InputError) as e_info:
+        cashocs.regular_mesh_scaled(3, [1.0, -1.0])
+    assert "sizes" in str(e_info.value)
+
+
 def test_mesh_quality_2D():
     mesh, _, _, _, _, _ = cashocs.regular_mesh(4)
 
@@ -389,6 +422,31 @@ def test_move_mesh():
     fenics.MPI.barrier(fenics.MPI.comm_world)
 
 
+def test_a_priori_determinants(rng):
+    mesh, _, _, _, _, _ = cashocs.regular_mesh(10)
+    a_priori_tester = cashocs.geometry.mesh_testing.APrioriMeshTester(mesh)
+
+    VCG = fenics.VectorFunctionSpace(mesh, "CG", 1)
+    DG0 = fenics.FunctionSpace(mesh, "DG", 0)
+    defo = fenics.Function(VCG)
+    dof_vector = rng.randn(defo.vector().local_size())
+    dof_vector *= mesh.hmin() / (4.0 * np.max(np.abs(dof_vector)))
+    defo.vector().set_local(dof_vector)
+    defo.vector().apply("")
+
+    determinants = a_priori_tester._compute_determinants(defo)
+    reference = fenics.project(fenics.det(fenics.Identity(2) + fenics.grad(defo)), DG0)
+    cells = mesh.cells()[: mesh.topology().ghost_offset(2)]
+    cell_dofs = [DG0.dofmap().cell_dofs(i)[0] for i in range(len(cells))]
+
+    assert np.allclose(determinants, reference.vector().get_local()[cell_dofs])
+
+    max_det = fenics.MPI.max(fenics.MPI.comm_world, np.max(determinants))
+    min_det = fenics.MPI.min(fenics.MPI.comm_world, np.min(determinants))
+    assert a_priori_tester.test(defo, 1.01 * max(max_det, 1 / min_det))
+    assert not a_priori_tester.test(defo, 0.99 * max(max_det, 1 / min_det))
+
+
 def test_eikonal_distance():
     mesh, _, boundaries, _, _, _ = cashocs.regular_mesh(16)
     dist = cashocs.geometry.compute_boundary_distance(mesh, boundaries, [1, 2, 3, 4])
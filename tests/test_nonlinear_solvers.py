@@ -97,6 +97,78 @@ def test_snes_solver():
     assert np.allclose(u.vector()[:], u_fen.vector()[:])
 
 
+def test_snes_solver_matrix_free():
+    mesh, _, boundaries, dx, ds, _ = cashocs.regular_mesh(5)
+    V = FunctionSpace(mesh, "CG", 1)
+
+    u = Function(V)
+    u_fen = Function(V)
+    v = TestFunction(V)
+
+    F = (
+        inner(grad(u), grad(v)) * dx
+        + Constant(1e2) * pow(u, 3) * v * dx
+        - Constant(1) * v * dx
+    )
+    bcs = cashocs.create_dirichlet_bcs(V, Constant(0), boundaries, [1, 2, 3, 4])
+
+    solve(F == 0, u, bcs)
+    u_fen.vector().vec().aypx(0.0, u.vector().vec())
+    u_fen.vector().apply("")
+    u.vector().vec().set(0.0)
+    u.vector().apply("")
+
+    petsc_options = {
+        "snes_type": "newtonls",
+        "snes_mf": None,
+        "snes_atol": 1e-10,
+        "snes_rtol": 1e-9,
+        "ksp_type": "gmres",
+        "ksp_rtol": 1e-12,
+        "pc_type": "none",
+    }
+
+    cashocs.snes_solve(F, u, bcs, petsc_options=petsc_options)
+
+    assert np.allclose(u.vector()[:], u_fen.vector()[:])
+
+
+def test_snes_solver_matrix_free_operator():
+    mesh, _, boundaries, dx, ds, _ = cashocs.regular_mesh(5)
+    V = FunctionSpace(mesh, "CG", 1)
+
+    u = Function(V)
+    u_fen = Function(V)
+    v = TestFunction(V)
+
+    F = (
+        inner(grad(u), grad(v)) * dx
+        + Constant(1e2) * pow(u, 3) * v * dx
+        - Constant(1) * v * dx
+    )
+    bcs = cashocs.create_dirichlet_bcs(V, Constant(0), boundaries, [1, 2, 3, 4])
+
+    solve(F == 0, u, bcs)
+    u_fen.vector().vec().aypx(0.0, u.vector().vec())
+    u_fen.vector().apply("")
+    u.vector().vec().set(0.0)
+    u.vector().apply("")
+
+    petsc_options = {
+        "snes_type": "newtonls",
+        "snes_mf_operator": None,
+        "snes_atol": 1e-10,
+        "snes_rtol": 1e-9,
+        "ksp_type": "gmres",
+        "ksp_rtol": 1e-12,
+        "pc_type": "jacobi",
+    }
+
+    cashocs.snes_solve(F, u, bcs, petsc_options=petsc_options)
+
+    assert np.allclose(u.vector()[:], u_fen.vector()[:])
+
+
 def test_newton_linearization(config_sop):
     config_sop.set("StateSystem", "is_linear", "False")
     config_sop.set("StateSystem", "newton_verbose", "True")
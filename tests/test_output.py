@@ -20,6 +20,7 @@ import pathlib
 import subprocess
 
 from fenics import *
+import numpy as np
 import pytest
 
 import cashocs
@@ -89,6 +90,29 @@ def test_time_suffix(config_ocp, dir_path, F, bcs, J, y, u, p):
     MPI.barrier(MPI.comm_world)
 
 
+def test_save_history_npz(config_ocp, dir_path, F, bcs, J, y, u, p):
+    config_ocp.set("Output", "result_dir", f"{dir_path}/out")
+    config_ocp.set("Output", "save_results", "True")
+    config_ocp.set("Output", "history_format", "npz")
+    u.vector().vec().set(0.0)
+    u.vector().apply("")
+    ocp = cashocs.OptimalControlProblem(F, bcs, J, y, u, p, config=config_ocp)
+    ocp.solve(algorithm="bfgs", rtol=1e-1)
+    MPI.barrier(MPI.comm_world)
+
+    assert pathlib.Path(dir_path + "/out/history.npz").is_file()
+    assert not pathlib.Path(dir_path + "/out/history.json").is_file()
+    history = np.load(dir_path + "/out/history.npz")
+    assert history["iterations"] == ocp.solver.iteration
+    assert len(history["cost_function_value"]) == ocp.solver.iteration + 1
+
+    MPI.barrier(MPI.comm_world)
+
+    if MPI.rank(MPI.comm_world) == 0:
+        subprocess.run(["rm", "-r", f"{dir_path}/out"], check=True)
+    MPI.barrier(MPI.comm_world)
+
+
 def test_save_xdmf_files_ocp(dir_path, F, bcs, J, y, u, p, config_ocp):
     config_ocp.set("Output", "save_state", "True")
     config_ocp.set("Output", "save_results", "True")
@@ -121,6 +145,36 @@ def test_save_xdmf_files_ocp(dir_path, F, bcs, J, y, u, p, config_ocp):
     MPI.barrier(MPI.comm_world)
 
 
+def test_output_flush_every(dir_path, F, bcs, J, y, u, p, config_ocp):
+    config_ocp.set("Output", "save_state", "True")
+    config_ocp.set("Output", "save_txt", "True")
+    config_ocp.set("Output", "flush_every", "2")
+    config_ocp.set("Output", "result_dir", dir_path + "/out")
+    u.vector().vec().set(0.0)
+    u.vector().apply("")
+    ocp = cashocs.OptimalControlProblem(F, bcs, J, y, u, p, config=config_ocp)
+    ocp.solve(algorithm="bfgs", rtol=1e-1)
+    MPI.barrier(MPI.comm_world)
+
+    state = Function(y.function_space())
+    with XDMFFile(MPI.comm_world, dir_path + "/out/checkpoints/state_0.xdmf") as file:
+        for i in range(ocp.solver.iteration + 1):
+            file.read_checkpoint(state, "state_0", i)
+    assert np.allclose(state.vector()[:], y.vector()[:])
+
+    with open(dir_path + "/out/history.txt", encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    iteration_lines = [line for line in lines if line[:4].strip().isdigit()]
+    assert len(iteration_lines) == ocp.solver.iteration + 1
+    assert "Optimization was successful." in lines
+
+    MPI.barrier(MPI.comm_world)
+
+    if MPI.rank(MPI.comm_world) == 0:
+        subprocess.run(["rm", "-r", f"{dir_path}/out"], check=True)
+    MPI.barrier(MPI.comm_world)
+
+
 def test_save_xdmf_files_mixed(dir_path, rng, config_ocp, geometry):
     config_ocp.set("Output", "save_state", "True")
     config_ocp.set("Output", "save_results", "True")